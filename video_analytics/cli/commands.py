@@ -6,21 +6,39 @@ Single command for auto-analysis + auto-chart generation.
 
 import sys
 import os
-import asyncio
+import shutil
+import traceback
+import functools
+from dataclasses import astuple, replace
 from typing import List
 import typer
 from rich.console import Console
-from rich.table import Table
 
-from ..core import safe_process_file
-from ..core.parallel_analyzer import ParallelAnalysisEngine, create_fast_config, create_detailed_config, create_memory_optimized_config
-from ..visualization import ChartGenerator, ChartStyles
+from ..utils.validators import is_url
 
 console = Console()
 
+# Chart type -> renderer(generator, video, audio, fps, metadata, config)
+_CHART_RENDERERS = {
+    "detailed": lambda generator, video, audio, fps, metadata, config: generator.generate_enhanced_chart(
+        metadata, video, audio, fps, config
+    ),
+    "combined": lambda generator, video, audio, fps, metadata, config: generator.generate_combined_chart(
+        video, audio, fps, config
+    ),
+}
+
+# Chart type -> ChartStyles preset name
+_CHART_PRESETS = {
+    "detailed": "enhanced_detailed",
+    "combined": "default",
+}
+
 
 def create_smart_config(metadata):
     """Create optimized configuration based on video duration."""
+    from ..core.parallel_analyzer import create_fast_config, create_detailed_config, create_memory_optimized_config
+    
     duration = metadata.duration
     if duration < 300:  # < 5 min - detailed analysis
         return create_detailed_config()
@@ -30,40 +48,61 @@ def create_smart_config(metadata):
         return create_memory_optimized_config()
 
 
-def generate_smart_chart(video_analysis, audio_analysis, fps_analysis, metadata, output_dir, input_path, chart_type="detailed"):
+@functools.lru_cache(maxsize=1)
+def _get_chart_generator():
+    """Per-process ChartGenerator: it is stateless, and its setup resets matplotlib styles."""
+    # The CLI only writes charts to files: select the non-interactive Agg backend before
+    # visualization imports pyplot, skipping GUI backend resolution (MPLBACKEND still wins)
+    if "MPLBACKEND" not in os.environ:
+        import matplotlib
+        matplotlib.use("Agg")
+    
+    from ..visualization import ChartGenerator
+    return ChartGenerator()
+
+
+def generate_smart_chart(video_analysis, audio_analysis, fps_analysis, metadata, output_dir, file_name, chart_type="detailed",
+                         output_format="png", compress_level=6):
     """Generate specified chart type."""
-    chart_generator = ChartGenerator()
+    chart_generator = _get_chart_generator()
     
-    # Use user-specified chart type (default: detailed)
-    if chart_type == "detailed":
-        config = ChartStyles.get_enhanced_preset(info_level='detailed')
-        chart_type_name = "detailed"
-    else:  # combined chart
-        config = ChartStyles.get_default_config()
-        chart_type_name = "combined"
+    # Deferred: pulls in matplotlib, which --help and input errors never need
+    from ..visualization import ChartStyles
     
-    # Setup output
-    config.output_dir = output_dir
-    config.title = f"Video Analysis - {os.path.basename(input_path)}"
+    # Use user-specified chart type (default: detailed)
+    # Derive this chart's config from the shared preset instead of rebuilding it per file
+    config = replace(
+        ChartStyles.get_base_config(_CHART_PRESETS[chart_type]),
+        output_dir=output_dir,
+        title=f"Video Analysis - {file_name}",
+        output_format=output_format,
+        compress_level=compress_level
+    )
     
     # Generate appropriate chart
-    if chart_type_name == "detailed":
-        chart_path = chart_generator.generate_enhanced_chart(
-            metadata, video_analysis, audio_analysis, fps_analysis, config
-        )
-    else:
-        chart_path = chart_generator.generate_combined_chart(
-            video_analysis, audio_analysis, fps_analysis, config
-        )
+    render = _CHART_RENDERERS[chart_type]
+    chart_path = render(chart_generator, video_analysis, audio_analysis, fps_analysis, metadata, config)
+    
+    return chart_path, chart_type
+
+
+@functools.lru_cache(maxsize=1)
+def _warm_up_renderer():
+    """Pay matplotlib's one-time font cache and backend setup before the first real chart (once per worker)."""
+    _get_chart_generator()  # Selects Agg, imports visualization and builds this worker's generator
+    import matplotlib.pyplot as plt
     
-    return chart_path, chart_type_name
+    fig = plt.figure(figsize=(0.1, 0.1))
+    fig.canvas.draw()
+    plt.close(fig)
 
 
 def generate_command(
     input_paths: List[str] = typer.Argument(..., help="Video file paths, HTTP URLs, or HLS stream URLs"),
     output_dir: str = typer.Option("./charts", "--output", "-o", help="Charts output directory"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed progress"),
-    chart_type: str = typer.Option("detailed", "--chart-type", help="Chart type: 'detailed' or 'combined'")
+    chart_type: str = typer.Option("detailed", "--chart-type", help="Chart type: 'detailed' or 'combined'"),
+    output_format: str = typer.Option("png", "--format", help="Chart file format: 'png' or 'svg'")
 ):
     """
     Generate professional video analysis charts with smart defaults.
@@ -77,130 +116,270 @@ def generate_command(
     """
     
     # Validate chart type
-    if chart_type not in ["detailed", "combined"]:
+    if chart_type not in _CHART_RENDERERS:
         console.print(f"[red]Error: Invalid chart type '{chart_type}'. Must be 'detailed' or 'combined'.[/red]")
         raise typer.Exit(1)
     
+    # Validate output format
+    if output_format not in ["png", "svg"]:
+        console.print(f"[red]Error: Invalid format '{output_format}'. Must be 'png' or 'svg'.[/red]")
+        raise typer.Exit(1)
+    
     # Check dependencies first
-    try:
-        import subprocess
-        subprocess.run(["ffprobe", "-version"], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    if shutil.which("ffprobe") is None:
         console.print("[red]Error: FFmpeg not found. Please install FFmpeg first.[/red]")
         console.print("Install from: https://ffmpeg.org/download.html")
         raise typer.Exit(1)
     
+    # Deferred: the analysis stack (ffmpeg, numpy, requests) and the async/progress
+    # machinery aren't needed for --help or bad arguments
+    import asyncio
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeRemainingColumn
+    from ..core import safe_process_file
+    from ..core.parallel_analyzer import ParallelAnalysisEngine
+    
+    # Deduplicate inputs (order preserved) and set aside missing local files
+    unique_paths = list(dict.fromkeys(
+        path if is_url(path) else os.path.abspath(path) for path in input_paths
+    ))
+    missing_files = [path for path in unique_paths if not is_url(path) and not os.path.isfile(path)]
+    total_inputs = len(unique_paths)
+    if missing_files:
+        missing_set = set(missing_files)
+        input_paths = [path for path in unique_paths if path not in missing_set]
+    else:
+        input_paths = unique_paths
+    
+    if not input_paths:
+        console.print("[red]Error: None of the input files exist.[/red]")
+        for missing_file in missing_files:
+            console.print(f"[dim]   - {missing_file}[/dim]")
+        raise typer.Exit(1)
+    
     console.print(f"[blue]🎬 Generating professional charts for {len(input_paths)} file(s)...[/blue]")
     
     # Setup output directory
     os.makedirs(output_dir, exist_ok=True)
     console.print(f"[green]📁 Output directory:[/green] {output_dir}")
     
+    # Multi-file runs get one chart subdirectory per input, all created up front in one pass.
+    # Inputs render concurrently and chart names only carry a timestamp, so inputs sharing a
+    # stem (a/clip.mp4, b/clip.mp4, clip.mkv) get numbered directories instead of one shared
+    if len(input_paths) > 1:
+        file_output_dirs = []
+        used_names = set()
+        for path in input_paths:
+            stem = os.path.splitext(os.path.basename(path))[0]
+            name, index = stem, 1
+            while name in used_names:
+                index += 1
+                name = f"{stem}_{index}"
+            used_names.add(name)
+            file_output_dirs.append(os.path.join(output_dir, name))
+        for file_output_dir in file_output_dirs:
+            os.makedirs(file_output_dir, exist_ok=True)
+    else:
+        file_output_dirs = [output_dir]
+    
     successful_files = []
     failed_files = []
     total_charts = []
+    analysis_times = []
     
-    for i, input_path in enumerate(input_paths, 1):
-        console.print(f"\n[blue]🔄 Processing {i}/{len(input_paths)}:[/blue] {os.path.basename(input_path)}")
-        
-        if verbose:
-            console.print(f"[dim]   Full path: {input_path}[/dim]")
+    # One engine per distinct analysis config, reused across files
+    engines = {}
+    
+    # Per-file detail is only worth the scrollback for single files or --verbose
+    show_details = verbose or len(input_paths) == 1
+    
+    # Batch charts favour fast PNG encoding over file size
+    compress_level = 1 if len(input_paths) > 1 else 6
+    
+    # Files in flight at once: analysis is ffprobe-bound, so overlapping files hides subprocess waits
+    max_concurrent = max(1, min(len(input_paths), (os.cpu_count() or 2) // 2))
+    
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("{task.description}"),
+        BarColumn(),
+        TextColumn("{task.completed}/{task.total}"),
+        TimeRemainingColumn(),
+        console=console
+    ) as progress:
+        batch_task = progress.add_task("[blue]Starting...[/blue]", total=len(input_paths))
         
-        try:
-            # Step 1: Process file (handles local files, HTTP URLs, HLS streams)
-            with console.status(f"[bold blue]Processing file..."):
-                processed_file = safe_process_file(input_path)
-                if processed_file is None:
-                    console.print(f"[red]✗ Failed to process: {input_path}[/red]")
-                    failed_files.append(input_path)
-                    continue
-            
-            # Step 2: Load metadata and optimize configuration  
-            metadata = processed_file.load_metadata()
-            config = create_smart_config(metadata)
-            
-            # Always enable all analysis types for best charts
-            config.enable_video = True
-            config.enable_audio = True  
-            config.enable_fps = True
-            
-            if verbose:
-                console.print(f"[dim]   Duration: {metadata.duration:.1f}s ({metadata.duration/60:.1f} min)[/dim]")
-                console.print(f"[dim]   Resolution: {metadata.width}x{metadata.height}[/dim]")
-                console.print(f"[dim]   Analysis mode: {config.__class__.__name__}[/dim]")
-            
-            # Step 3: Run parallel analysis
-            async def run_analysis():
-                engine = ParallelAnalysisEngine(config)
-                return await engine.analyze_all(processed_file)
-            
-            with console.status(f"[bold green]🔍 Running smart analysis..."):
-                combined_result = asyncio.run(run_analysis())
-            
-            # Check analysis success
-            if not all([combined_result.video_analysis, combined_result.audio_analysis, combined_result.fps_analysis]):
-                console.print(f"[red]✗ Analysis incomplete for: {input_path}[/red]")
-                failed_files.append(input_path)
-                continue
-            
-            # Step 4: Generate optimized charts
-            file_output_dir = output_dir
-            if len(input_paths) > 1:  # Create subdirectories for multiple files
-                file_basename = os.path.splitext(os.path.basename(input_path))[0]
-                file_output_dir = os.path.join(output_dir, file_basename)
-                os.makedirs(file_output_dir, exist_ok=True)
-            
-            with console.status(f"[bold magenta]📊 Generating smart charts..."):
-                chart_path, actual_chart_type = generate_smart_chart(
-                    combined_result.video_analysis,
-                    combined_result.audio_analysis, 
-                    combined_result.fps_analysis,
-                    metadata,
-                    file_output_dir,
-                    input_path,
-                    chart_type
-                )
-            
-            # Success summary
-            console.print(f"[green]✅ Completed in {combined_result.execution_time:.1f}s[/green]")
-            console.print(f"   📊 Chart type: {actual_chart_type}")
-            console.print(f"   💾 Saved: {os.path.basename(chart_path)}")
+        async def process_one(input_path, file_output_dir, semaphore):
+            async with semaphore:
+                file_name = os.path.basename(input_path)
             
-            if verbose:
-                # Show key analysis metrics
-                video = combined_result.video_analysis
-                audio = combined_result.audio_analysis
-                fps = combined_result.fps_analysis
-                console.print(f"[dim]   Video: {video.average_bitrate/1000000:.1f} Mbps ({video.encoding_type.split()[0]})[/dim]")
-                console.print(f"[dim]   Audio: {audio.average_bitrate/1000:.0f} kbps ({audio.quality_level})[/dim]")
-                console.print(f"[dim]   FPS: {fps.actual_average_fps:.1f} fps ({fps.total_dropped_frames} drops)[/dim]")
+                if verbose:
+                    console.print(f"[dim]   Full path: {input_path}[/dim]")
             
-            successful_files.append(input_path)
-            total_charts.append(chart_path)
-            
-        except Exception as e:
-            console.print(f"[red]✗ Error processing {input_path}: {str(e)}[/red]")
-            failed_files.append(input_path)
-            if verbose:
-                import traceback
-                console.print(f"[dim]{traceback.format_exc()}[/dim]")
+                try:
+                    # Step 1: Process file (handles local files, HTTP URLs, HLS streams)
+                    # Downloads and ffprobe block, so run them off the loop to overlap across files
+                    loop = asyncio.get_running_loop()
+                    progress.update(batch_task, description=f"[blue]{file_name}[/blue] [dim]processing file[/dim]")
+                    # No inner download bars or prompts: several inputs are acquired at once on
+                    # worker threads, underneath the batch progress display
+                    processed_file = await loop.run_in_executor(
+                        None,
+                        functools.partial(safe_process_file, input_path, show_progress=False, interactive=False)
+                    )
+                    if processed_file is None:
+                        console.print(f"[red]✗ Failed to process: {input_path}[/red]")
+                        failed_files.append(input_path)
+                        return
+                
+                    # Step 2: Load metadata and optimize configuration  
+                    metadata = await loop.run_in_executor(None, processed_file.load_metadata)
+                    config = create_smart_config(metadata)
+                
+                    # Always enable all analysis types for best charts
+                    config.enable_video = True
+                    config.enable_audio = True  
+                    config.enable_fps = True
+                
+                    if verbose:
+                        console.print(
+                            f"[dim]   Duration: {metadata.duration:.1f}s ({metadata.duration/60:.1f} min)\n"
+                            f"   Resolution: {metadata.width}x{metadata.height}\n"
+                            f"   Analysis mode: {config.__class__.__name__}[/dim]",
+                            highlight=False
+                        )
+                
+                    # Step 3: Run parallel analysis
+                    engine_key = astuple(config)
+                    engine = engines.get(engine_key)
+                    if engine is None:
+                        engine = engines[engine_key] = ParallelAnalysisEngine(config, concurrent_files=max_concurrent)
+                
+                    progress.update(batch_task, description=f"[blue]{file_name}[/blue] [dim]running analysis[/dim]")
+                    combined_result = await engine.analyze_all(processed_file)
+                
+                    # Check analysis success
+                    if not combined_result.is_complete:
+                        console.print(f"[red]✗ Analysis incomplete for: {input_path}[/red]")
+                        failed_files.append(input_path)
+                        return
+                
+                    # Step 4: Generate optimized charts
+                    progress.update(batch_task, description=f"[blue]{file_name}[/blue] [dim]generating charts[/dim]")
+                    chart_path, actual_chart_type = await loop.run_in_executor(
+                        render_executor,
+                        functools.partial(
+                            generate_smart_chart,
+                            combined_result.video_analysis,
+                            combined_result.audio_analysis,
+                            combined_result.fps_analysis,
+                            metadata,
+                            file_output_dir,
+                            file_name,
+                            chart_type,
+                            output_format,
+                            compress_level
+                        )
+                    )
+                
+                    # Success summary
+                    if show_details:
+                        console.print(
+                            f"[green]✅ {file_name} completed in {combined_result.execution_time:.1f}s[/green]\n"
+                            f"   📊 Chart type: {actual_chart_type}\n"
+                            f"   💾 Saved: {os.path.basename(chart_path)}"
+                        )
+                
+                    if verbose:
+                        # Show key analysis metrics
+                        video = combined_result.video_analysis
+                        audio = combined_result.audio_analysis
+                        fps = combined_result.fps_analysis
+                        console.print(
+                            f"[dim]   Video: {video.average_bitrate/1000000:.1f} Mbps ({video.encoding_type.split()[0]})\n"
+                            f"   Audio: {audio.average_bitrate/1000:.0f} kbps ({audio.quality_level})\n"
+                            f"   FPS: {fps.actual_average_fps:.1f} fps ({fps.total_dropped_frames} drops)[/dim]",
+                            highlight=False
+                        )
+                
+                    successful_files.append(input_path)
+                    total_charts.append(chart_path)
+                    analysis_times.append(combined_result.execution_time)
+                
+                except Exception as e:
+                    console.print(f"[red]✗ Error processing {input_path}: {str(e)}[/red]")
+                    failed_files.append(input_path)
+                    if verbose:
+                        console.print(f"[dim]{traceback.format_exc()}[/dim]")
+                finally:
+                    progress.update(batch_task, advance=1)
+        
+        async def process_all():
+            if sys.version_info >= (3, 12):
+                # Short per-file coroutines start eagerly instead of waiting a loop iteration
+                asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+            semaphore = asyncio.Semaphore(max_concurrent)
+            await asyncio.gather(*(
+                process_one(input_path, file_output_dir, semaphore)
+                for input_path, file_output_dir in zip(input_paths, file_output_dirs)
+            ))
+        
+        # pyplot is not thread-safe: batches render in worker processes for real parallelism,
+        # a single chart goes through one worker thread to skip process start-up.
+        # Workers are spawned, not forked: this process already runs the live display,
+        # executor and HTTP pool threads, whose held locks a fork would inherit
+        if len(input_paths) > 1:
+            render_executor = ProcessPoolExecutor(
+                max_workers=min(len(input_paths), os.cpu_count() or 1),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_warm_up_renderer
+            )
+        else:
+            render_executor = ThreadPoolExecutor(max_workers=1, initializer=_warm_up_renderer)
+        
+        # Start a render worker now so its warm-up overlaps the first file's analysis
+        # (the initializer does the work; this call is then a cached no-op)
+        render_executor.submit(_warm_up_renderer)
+        
+        try:
+            with render_executor:
+                asyncio.run(process_all())
+        finally:
+            for engine in engines.values():
+                engine.shutdown()
+        
+        progress.update(batch_task, description="[blue]Done[/blue]")
+    
+    # Final summary, rendered in one print
+    summary = [
+        "\n[bold blue]📈 Generation Summary:[/bold blue]",
+        f"[green]✅ Successful: {len(successful_files)}/{total_inputs} files[/green]"
+    ]
     
-    # Final summary
-    console.print(f"\n[bold blue]📈 Generation Summary:[/bold blue]")
-    console.print(f"[green]✅ Successful: {len(successful_files)}/{len(input_paths)} files[/green]")
+    if missing_files:
+        summary.append(f"[red]❌ Not found: {len(missing_files)} files[/red]")
+        summary.extend(f"[dim]   - {missing_file}[/dim]" for missing_file in missing_files)
     
     if failed_files:
-        console.print(f"[red]❌ Failed: {len(failed_files)} files[/red]")
+        summary.append(f"[red]❌ Failed: {len(failed_files)} files[/red]")
         if verbose:
-            for failed_file in failed_files:
-                console.print(f"[dim]   - {failed_file}[/dim]")
+            summary.extend(f"[dim]   - {failed_file}[/dim]" for failed_file in failed_files)
     
-    console.print(f"[blue]📊 Total charts generated: {len(total_charts)}[/blue]")
-    console.print(f"[green]📁 Output location: {output_dir}[/green]")
+    summary.append(f"[blue]📊 Total charts generated: {len(total_charts)}[/blue]")
+    
+    if verbose and len(analysis_times) > 1:
+        # Per-file analysis latency is skewed by long inputs; quantiles say more than a mean
+        import numpy as np
+        p50, p95 = np.quantile(analysis_times, [0.5, 0.95])
+        summary.append(f"[dim]   Analysis time per file: p50 {p50:.1f}s, p95 {p95:.1f}s, max {max(analysis_times):.1f}s[/dim]")
+    summary.append(f"[green]📁 Output location: {output_dir}[/green]")
     
     if successful_files and not verbose:
-        console.print(f"\n[dim]💡 Use --verbose (-v) for detailed analysis metrics[/dim]")
+        summary.append("\n[dim]💡 Use --verbose (-v) for detailed analysis metrics[/dim]")
+    
+    console.print("\n".join(summary))
     
     # Exit with error code if any files failed
-    if failed_files:
+    if failed_files or missing_files:
         raise typer.Exit(1)
\ No newline at end of file
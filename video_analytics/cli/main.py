@@ -15,7 +15,9 @@ from .commands import (
 app = typer.Typer(
     help="Professional video chart generator - one command, smart defaults",
     add_completion=False,
-    no_args_is_help=True
+    no_args_is_help=True,
+    rich_markup_mode=None,           # Help text has no markup; skip Rich markup rendering
+    pretty_exceptions_enable=False   # main() already reports errors
 )
 
 # Global console
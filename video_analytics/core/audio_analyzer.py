@@ -3,17 +3,68 @@ Audio bitrate analysis module
 Analyzes audio bitrate over time and provides quality assessment and statistics.
 """
 
-import json
+import csv
+import io
+import os
 import subprocess
+import threading
+import warnings
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Optional
+from functools import cached_property, lru_cache
+from typing import List, Optional, Tuple
 from datetime import datetime
 import numpy as np
 
-from .file_processor import ProcessedFile
+try:
+    import av  # type: ignore
+except Exception:  # pragma: no cover
+    av = None  # Optional in-process demuxer; ffprobe is used otherwise
+
+from .file_processor import ProcessedFile, VideoMetadata
+from .stats import change_ratios, summarize
 from ..utils.logger import get_logger
+from ..utils.json_io import dump_json
 from ..utils.validators import ensure_non_empty_sequence
 
+# Write buffer for CSV exports (bytes)
+_CSV_BUFFER_SIZE = 1 << 20
+
+# ffprobe packet scan: stdout read size (bytes) and time limit (seconds)
+_PACKET_READ_SIZE = 1 << 20
+_PACKET_SCAN_TIMEOUT = 30
+
+# Analyses memoized per analyzer (oldest evicted first): repeat calls come
+# right after the first one, while the arrays of a whole batch add up
+_ANALYSIS_CACHE_ENTRIES = 8
+
+# Codec -> kbps lower bounds for Fair, Good, Excellent (below the first is Poor)
+_QUALITY_THRESHOLDS_KBPS = {
+    'aac': (96, 128, 256),
+    'mp3': (128, 192, 320),
+}
+_QUALITY_LABELS = ("Poor", "Fair", "Good", "Excellent")
+
+# Channel count -> layout name
+_LAYOUTS = {
+    1: "Mono",
+    2: "Stereo",
+    3: "2.1 Surround",
+    4: "4.0 Surround",
+    5: "4.1 Surround",
+    6: "5.1 Surround",
+    7: "6.1 Surround",
+    8: "7.1 Surround",
+}
+
+
+@lru_cache(maxsize=16)
+def _channel_layout(channels: int) -> str:
+    """Layout name for a channel count (e.g. "10ch" when unknown)"""
+    return _LAYOUTS.get(channels, f"{channels}ch")
+
 
 @dataclass
 class AudioBitrateDataPoint:
@@ -22,7 +73,7 @@ class AudioBitrateDataPoint:
     bitrate: float     # bitrate (bps)
 
 
-@dataclass
+@dataclass(eq=False)  # ndarray fields make the generated __eq__ raise; compare by identity
 class AudioBitrateAnalysis:
     """Audio bitrate analysis result"""
     file_path: str
@@ -39,13 +90,22 @@ class AudioBitrateAnalysis:
     min_bitrate: float       # min bitrate (bps)
     bitrate_variance: float  # variance
     
-    # Time series
-    data_points: List[AudioBitrateDataPoint]
+    # Time series (one array per column)
+    timestamps: np.ndarray   # sample times (seconds)
+    bitrates: np.ndarray     # bitrate per sample (bps)
     
     # Sampling
     sample_interval: float   # interval (seconds)
     
-    @property
+    @cached_property
+    def data_points(self) -> List[AudioBitrateDataPoint]:
+        """Per-sample view of the series (built on first access)"""
+        return [
+            AudioBitrateDataPoint(timestamp, bitrate)
+            for timestamp, bitrate in zip(self.timestamps.tolist(), self.bitrates.tolist())
+        ]
+    
+    @cached_property
     def bitrate_stability(self) -> float:
         """Compute bitrate stability (0-1, higher means more stable)"""
         if self.average_bitrate == 0:
@@ -53,45 +113,65 @@ class AudioBitrateAnalysis:
         cv = np.sqrt(self.bitrate_variance) / self.average_bitrate
         return max(0, 1 - cv)
     
-    @property
+    @cached_property
     def quality_level(self) -> str:
         """Simple quality level evaluation (English labels)"""
-        avg_kbps = self.average_bitrate / 1000
-        
-        if self.codec.lower() == 'aac':
-            if avg_kbps >= 256:
-                return "Excellent"
-            elif avg_kbps >= 128:
-                return "Good"
-            elif avg_kbps >= 96:
-                return "Fair"
-            else:
-                return "Poor"
-        
-        elif self.codec.lower() == 'mp3':
-            if avg_kbps >= 320:
-                return "Excellent"
-            elif avg_kbps >= 192:
-                return "Good"
-            elif avg_kbps >= 128:
-                return "Fair"
-            else:
-                return "Poor"
-        
-        else:
+        thresholds = _QUALITY_THRESHOLDS_KBPS.get(self.codec.lower())
+        if thresholds is None:
             return "Unknown"
+        return _QUALITY_LABELS[bisect_right(thresholds, self.average_bitrate / 1000)]
 
 
 class AudioBitrateAnalyzer:
     """Audio bitrate analyzer"""
     
-    def __init__(self, sample_interval: float = 15.0):
+    def __init__(self, sample_interval: float = 15.0, backend: str = 'auto'):
+        """
+        Initialize audio analyzer
+        
+        Args:
+            sample_interval: Sampling interval (seconds)
+            backend: Packet reader - 'ffprobe' (subprocess), 'pyav' (in-process, needs PyAV),
+                or 'auto' (PyAV when installed, falling back to ffprobe per file)
+        """
+        if backend not in ('auto', 'ffprobe', 'pyav'):
+            raise ValueError(f"Unknown packet backend: {backend}")
+        if backend == 'pyav' and av is None:
+            raise ValueError("PyAV backend requested but PyAV is not installed")
+        
         self.sample_interval = sample_interval  # audio sampling interval
+        self._auto_backend = backend == 'auto'
+        if self._auto_backend:
+            backend = 'pyav' if av is not None else 'ffprobe'
+        self.backend = backend
         self._bitrate_cache = {}  # cache
+        self._analysis_cache = {}  # (path, mtime_ns, size, interval) -> AudioBitrateAnalysis
+        self._analysis_cache_lock = threading.Lock()
         self._logger = get_logger(__name__)
     
     def analyze(self, processed_file: ProcessedFile) -> AudioBitrateAnalysis:
-        """Analyze audio bitrate"""
+        """Analyze audio bitrate (repeat calls on an unchanged file are served from cache)"""
+        try:
+            st = os.stat(processed_file.file_path)
+            cache_key = (processed_file.file_path, st.st_mtime_ns, st.st_size, self.sample_interval)
+        except OSError:
+            cache_key = None
+        
+        cached = self._analysis_cache.get(cache_key) if cache_key else None
+        if cached is not None:
+            self._logger.debug(f"Using cached audio analysis: {processed_file.file_path}")
+            return cached
+        
+        analysis = self._analyze(processed_file)
+        if cache_key:
+            with self._analysis_cache_lock:
+                self._analysis_cache[cache_key] = analysis
+                if len(self._analysis_cache) > _ANALYSIS_CACHE_ENTRIES:
+                    del self._analysis_cache[next(iter(self._analysis_cache))]
+        return analysis
+    
+    def _analyze(self, processed_file: ProcessedFile) -> AudioBitrateAnalysis:
+        """Run the audio bitrate analysis"""
         metadata = processed_file.load_metadata()
         
         if not metadata.audio_codec:
@@ -105,28 +185,22 @@ class AudioBitrateAnalyzer:
         
         self._logger.debug(f"Total sample points: {len(sample_times)} ...")
         
-        # 采样分析
-        data_points = []
-        for i, timestamp in enumerate(sample_times):
-            try:
-                bitrate = self._get_audio_bitrate_at_time(processed_file.file_path, timestamp)
-                data_points.append(AudioBitrateDataPoint(timestamp, bitrate))
-                
-                # progress
-                if (i + 1) % 5 == 0 or i == len(sample_times) - 1:
-                    progress = (i + 1) / len(sample_times) * 100
-                    self._logger.debug(f"Audio analysis progress: {progress:.1f}%")
-                    
-            except Exception as e:
-                self._logger.warning(f"Audio sampling failed at {timestamp:.1f}s: {e}")
-                # fallback to metadata bitrate
-                fallback_bitrate = metadata.audio_bitrate or (metadata.bit_rate * 0.1) if metadata.bit_rate else 128000
-                data_points.append(AudioBitrateDataPoint(timestamp, fallback_bitrate))
-        
-        ensure_non_empty_sequence("audio bitrate data points", data_points)
+        # 一次读取全部音频包，再按采样窗口向量化统计
+        packets = self._get_all_audio_packets(processed_file.file_path)
+        if packets is not None:
+            bitrates = self._window_bitrates(*packets, sample_times)
+        else:
+            bitrates = np.full(len(sample_times), np.nan)
+        
+        # Windows without packets fall back to the file-level bitrate
+        missing = np.isnan(bitrates)
+        if missing.any():
+            bitrates[missing] = self._get_fallback_audio_bitrate(metadata)
+        
+        ensure_non_empty_sequence("audio bitrate data points", bitrates)
         
         # 计算统计信息
-        bitrates = [dp.bitrate for dp in data_points]
+        average, maximum, minimum, variance = summarize(bitrates)
         
         return AudioBitrateAnalysis(
             file_path=processed_file.file_path,
@@ -134,183 +208,199 @@ class AudioBitrateAnalyzer:
             codec=metadata.audio_codec,
             channels=metadata.channels or 2,
             sample_rate=int(metadata.sample_rate) if metadata.sample_rate else 44100,
-            average_bitrate=float(np.mean(bitrates)),
-            max_bitrate=float(np.max(bitrates)),
-            min_bitrate=float(np.min(bitrates)),
-            bitrate_variance=float(np.var(bitrates)),
-            data_points=data_points,
+            average_bitrate=average,
+            max_bitrate=maximum,
+            min_bitrate=minimum,
+            bitrate_variance=variance,
+            timestamps=sample_times,
+            bitrates=bitrates,
             sample_interval=self.sample_interval
         )
     
-    def _get_audio_bitrate_at_time(self, file_path: str, timestamp: float, window_size: float = 10.0) -> float:
-        """Get audio bitrate at a timestamp using a real time window"""
+    def _get_all_audio_packets(self, file_path: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Read every audio packet in a single pass
+        
+        Returns:
+            (pts_time, size) arrays sorted by pts_time, or None if unavailable
+        """
+        if self.backend == 'pyav':
+            packets = self._demux_audio_packets(file_path)
+            if packets is None and self._auto_backend:
+                packets = self._probe_audio_packets(file_path)  # container PyAV can't demux
+        else:
+            packets = self._probe_audio_packets(file_path)
+        if packets is None:
+            return None
+        
+        packets = packets[np.isfinite(packets).all(axis=1)]
+        if not len(packets):
+            return None
+        
+        pts, size = packets[:, 0], packets[:, 1]
+        if np.any(pts[1:] < pts[:-1]):
+            order = np.argsort(pts, kind='stable')
+            pts, size = pts[order], size[order]
+        return pts, size
+    
+    def _probe_audio_packets(self, file_path: str) -> Optional[np.ndarray]:
+        """Dump audio packets with one streamed ffprobe run as an (n, 2) [pts_time, size] array"""
+        cmd = [
+            'ffprobe',
+            '-v', 'quiet',
+            '-show_packets',
+            '-select_streams', 'a:0',
+            '-show_entries', 'packet=size,pts_time',
+            '-of', 'csv=p=0',
+            file_path
+        ]
+        
         try:
-            # Use ffprobe to analyze audio packets within the time window
-            end_time = timestamp + window_size
-            
-            # 获取音频包信息
-            cmd = [
-                'ffprobe',
-                '-v', 'quiet',
-                '-show_packets',
-                '-select_streams', 'a:0',
-                '-show_entries', 'packet=size,pts_time',
-                '-of', 'csv=p=0',
-                file_path
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            
-            if result.returncode != 0 or not result.stdout.strip():
-                # Fallback if no packet info
-                return self._get_fallback_audio_bitrate(file_path)
-            
-            # Parse packet data
-            total_bytes = 0
-            packet_count = 0
-            valid_timestamps = []
-            
-            for line in result.stdout.strip().split('\n'):
-                if line and ',' in line:
-                    try:
-                        parts = line.split(',')
-                        if len(parts) >= 2:
-                            pts_time_str, size_str = parts[0], parts[1]
-                            
-                            if size_str and pts_time_str:
-                                pts_time = float(pts_time_str)
-                                packet_size = int(size_str)
-                                
-                                # ensure inside window
-                                if timestamp <= pts_time <= end_time:
-                                    total_bytes += packet_size
-                                    packet_count += 1
-                                    valid_timestamps.append(pts_time)
-                    except (ValueError, IndexError):
-                        continue
-            
-            if packet_count == 0 or not valid_timestamps:
-                return self._get_fallback_audio_bitrate(file_path)
-            
-            # compute actual duration
-            if len(valid_timestamps) > 1:
-                actual_duration = max(valid_timestamps) - min(valid_timestamps)
-                if actual_duration > 0:
-                    # bitrate = (total_bytes * 8) / duration
-                    bitrate = (total_bytes * 8) / actual_duration
-                    return bitrate
-            
-            # use window size if duration invalid
-            if window_size > 0:
-                return (total_bytes * 8) / window_size
-            
-            return self._get_fallback_audio_bitrate(file_path)
-            
-        except (subprocess.TimeoutExpired, subprocess.SubprocessError, Exception) as e:
-            self._logger.warning(f"Audio bitrate analysis failed at {timestamp:.1f}s: {e}")
-            return self._get_fallback_audio_bitrate(file_path)
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        except OSError as e:
+            self._logger.warning(f"Audio packet scan failed: {e}")
+            return None
+        
+        # Parse the dump block by block while ffprobe is still producing it;
+        # the watchdog keeps the old 30 s limit on a stuck ffprobe
+        watchdog = threading.Timer(_PACKET_SCAN_TIMEOUT, proc.kill)
+        watchdog.start()
+        blocks = []
+        try:
+            with proc.stdout:
+                pending = b''
+                while True:
+                    chunk = proc.stdout.read(_PACKET_READ_SIZE)
+                    if not chunk:
+                        break
+                    data = pending + chunk
+                    cut = data.rfind(b'\n') + 1
+                    complete, pending = data[:cut], data[cut:]
+                    if complete.strip():
+                        blocks.append(self._parse_packet_lines(complete))
+                if pending.strip():
+                    blocks.append(self._parse_packet_lines(pending))
+            returncode = proc.wait()
+        except ValueError as e:
+            proc.kill()
+            proc.wait()
+            self._logger.warning(f"Unparseable audio packet data: {e}")
+            return None
+        finally:
+            watchdog.cancel()
+        
+        if returncode != 0 or not blocks:
+            if returncode < 0:
+                self._logger.warning(f"Audio packet scan timed out after {_PACKET_SCAN_TIMEOUT}s")
+            return None
+        
+        return np.concatenate(blocks)
     
-    def _get_fallback_audio_bitrate(self, file_path: str) -> float:
+    def _demux_audio_packets(self, file_path: str) -> Optional[np.ndarray]:
+        """Demux audio packets in-process with PyAV (no decoding, no subprocess)"""
+        pts_times = array('d')
+        sizes = array('d')
+        try:
+            with av.open(file_path) as container:
+                if not container.streams.audio:
+                    return None
+                stream = container.streams.audio[0]
+                time_base = float(stream.time_base)
+                for packet in container.demux(stream):
+                    if packet.pts is None:
+                        continue  # flush packet / unknown timestamp
+                    pts_times.append(packet.pts * time_base)
+                    sizes.append(packet.size)
+        except Exception as e:
+            self._logger.warning(f"Audio packet demux failed: {e}")
+            return None
+        
+        if not pts_times:
+            return None
+        return np.column_stack((np.frombuffer(pts_times), np.frombuffer(sizes)))
+    
+    @staticmethod
+    def _parse_packet_lines(data: bytes) -> np.ndarray:
+        """
+        Parse 'pts_time,size' CSV lines into an (n, 2) array
+        
+        Unparseable fields (e.g. N/A) become NaN and lines with too few fields are
+        skipped, so one malformed or truncated line never discards the whole scan.
+        """
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')  # per-line notices for the skipped lines
+            rows = np.genfromtxt(
+                io.BytesIO(data), delimiter=',', usecols=(0, 1), dtype=np.float64,
+                invalid_raise=False
+            )
+        return np.asarray(rows, dtype=np.float64).reshape(-1, 2)
+    
+    @staticmethod
+    def _window_bitrates(pts: np.ndarray, size: np.ndarray, sample_times: np.ndarray,
+                         window_size: float = 10.0) -> np.ndarray:
+        """
+        Bitrate of the packets in [t, t + window_size] for each sample time t
+        
+        Uses the span of packet timestamps inside the window when it is positive,
+        else the window size; windows with no packets are NaN.
+        """
+        lo = np.searchsorted(pts, sample_times, side='left')
+        hi = np.searchsorted(pts, sample_times + window_size, side='right')
+        count = hi - lo
+        
+        cumulative = np.concatenate(([0.0], np.cumsum(size)))
+        total_bits = (cumulative[hi] - cumulative[lo]) * 8
+        
+        has_packets = count > 0
+        last = np.maximum(hi - 1, 0)
+        first = np.minimum(lo, len(pts) - 1)
+        span = np.where(has_packets, pts[last] - pts[first], 0.0)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            bitrates = np.where(span > 0, total_bits / span, total_bits / window_size)
+        return np.where(has_packets, bitrates, np.nan)
+    
+    def _get_fallback_audio_bitrate(self, metadata: VideoMetadata) -> float:
         """Get fallback audio bitrate (based on file-level info)"""
         # 添加缓存以避免重复计算同一文件的备选码率
-        if not hasattr(self, '_bitrate_cache'):
-            self._bitrate_cache = {}
-        
-        if file_path in self._bitrate_cache:
-            return self._bitrate_cache[file_path]
-        
+        cache = self._bitrate_cache
         try:
-            # Try to get declared audio stream bitrate
-            cmd = [
-                'ffprobe',
-                '-v', 'quiet',
-                '-show_entries', 'stream=bit_rate',
-                '-select_streams', 'a:0',
-                '-of', 'csv=p=0',
-                file_path
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=10)
-            bitrate_str = result.stdout.strip()
-            
-            if bitrate_str and bitrate_str != 'N/A':
-                bitrate = float(bitrate_str)
-                self._bitrate_cache[file_path] = bitrate
-                return bitrate
-            else:
-                # If not available, estimate from file
-                estimated_bitrate = self._estimate_audio_bitrate_from_file(file_path)
-                self._bitrate_cache[file_path] = estimated_bitrate
-                return estimated_bitrate
-                
-        except Exception:
-            estimated_bitrate = self._estimate_audio_bitrate_from_file(file_path)
-            self._bitrate_cache[file_path] = estimated_bitrate
-            return estimated_bitrate
+            return cache[metadata.file_path]
+        except KeyError:
+            bitrate = cache[metadata.file_path] = self._estimate_audio_bitrate(metadata)
+            return bitrate
     
-    def _estimate_audio_bitrate_from_file(self, file_path: str) -> float:
-        """Estimate audio bitrate from file info"""
-        try:
-            import ffmpeg
-            probe = ffmpeg.probe(file_path)
-            
-            # First try audio stream info
-            audio_streams = [s for s in probe.get('streams', []) if s.get('codec_type') == 'audio']
-            if audio_streams:
-                audio_stream = audio_streams[0]  # 使用第一个音频流
-                
-                # Try stream bitrate
-                stream_bitrate = audio_stream.get('bit_rate')
-                if stream_bitrate:
-                    return float(stream_bitrate)
-            
-            # Otherwise, estimate from total bitrate
-            format_info = probe.get('format', {})
-            total_bitrate = format_info.get('bit_rate')
-            
-            if total_bitrate:
-                # Adjust ratio based on presence of video stream
-                video_streams = [s for s in probe.get('streams', []) if s.get('codec_type') == 'video']
-                
-                if video_streams:
-                    # With video, audio is typically 5-15%
-                    video_bitrate = video_streams[0].get('bit_rate')
-                    if video_bitrate:
-                        estimated_audio_ratio = min(0.15, 200000 / float(video_bitrate))
-                    else:
-                        estimated_audio_ratio = 0.1  # 默认10%
-                    return float(total_bitrate) * estimated_audio_ratio
+    def _estimate_audio_bitrate(self, metadata: VideoMetadata) -> float:
+        """Estimate audio bitrate from already-probed metadata (no extra ffprobe)"""
+        # Declared audio stream bitrate
+        if metadata.audio_bitrate:
+            return float(metadata.audio_bitrate)
+        
+        # Otherwise, estimate from total bitrate
+        if metadata.bit_rate:
+            # Adjust ratio based on presence of video stream
+            if metadata.video_codec:
+                # With video, audio is typically 5-15%
+                if metadata.video_bitrate:
+                    estimated_audio_ratio = min(0.15, 200000 / metadata.video_bitrate)
                 else:
-                    # Audio-only case
-                    return float(total_bitrate)
-            else:
-                # Estimate from file size and duration
-                duration = float(format_info.get('duration', 1))
-                file_size = int(format_info.get('size', 0))
-                if duration > 0 and file_size > 0:
-                    total_bitrate = (file_size * 8) / duration
-                    # Assume audio-only or audio-dominant
-                    return total_bitrate * 0.8
-                
-        except Exception:
-            pass
+                    estimated_audio_ratio = 0.1  # 默认10%
+                return float(metadata.bit_rate) * estimated_audio_ratio
+            # Audio-only case
+            return float(metadata.bit_rate)
+        
+        # Estimate from file size and duration
+        if metadata.duration > 0 and metadata.file_size > 0:
+            total_bitrate = (metadata.file_size * 8) / metadata.duration
+            # Assume audio-only or audio-dominant
+            return total_bitrate * 0.8
         
         # Default
         return 128000.0  # 128 kbps
     
     def get_channel_layout(self, channels: int) -> str:
         """Infer channel layout from channel count"""
-        layouts = {
-            1: "Mono",
-            2: "Stereo",
-            3: "2.1 Surround",
-            4: "4.0 Surround",
-            5: "4.1 Surround",
-            6: "5.1 Surround",
-            7: "6.1 Surround",
-            8: "7.1 Surround"
-        }
-        return layouts.get(channels, f"{channels}ch")
+        return _channel_layout(channels)
     
     def assess_audio_quality(self, analysis: AudioBitrateAnalysis) -> dict:
         """Assess audio quality"""
@@ -377,14 +467,12 @@ class AudioBitrateAnalyzer:
     
     def _detect_vbr(self, analysis: AudioBitrateAnalysis) -> bool:
         """Detect whether the audio is VBR"""
-        if not analysis.data_points or len(analysis.data_points) < 3:
+        if len(analysis.bitrates) < 3:
             return False
         
-        bitrates = [dp.bitrate for dp in analysis.data_points]
-        
-        # Coefficient of variation (std/mean)
-        bitrate_std = np.std(bitrates)
-        bitrate_mean = np.mean(bitrates)
+        # Coefficient of variation (std/mean), from the statistics analyze() already computed
+        bitrate_std = np.sqrt(analysis.bitrate_variance)
+        bitrate_mean = analysis.average_bitrate
         
         if bitrate_mean > 0:
             cv = bitrate_std / bitrate_mean
@@ -395,7 +483,8 @@ class AudioBitrateAnalyzer:
     
     def _detect_bitrate_changes(self, analysis: AudioBitrateAnalysis) -> dict:
         """Detect bitrate changes"""
-        if len(analysis.data_points) < 2:
+        bitrates = analysis.bitrates
+        if len(bitrates) < 2:
             return {
                 "total_changes": 0,
                 "significant_changes": 0,
@@ -403,34 +492,34 @@ class AudioBitrateAnalyzer:
                 "change_points": []
             }
         
-        changes = []
-        significant_changes = 0
-        change_points = []
-        
-        # Change between consecutive samples
-        for i in range(1, len(analysis.data_points)):
-            prev_bitrate = analysis.data_points[i-1].bitrate
-            curr_bitrate = analysis.data_points[i].bitrate
-            
-            if prev_bitrate > 0:  # 避免除以零
-                change_ratio = abs(curr_bitrate - prev_bitrate) / prev_bitrate
-                changes.append(change_ratio)
-                
-                # >10% change considered significant
-                if change_ratio > 0.1:
-                    significant_changes += 1
-                    change_points.append({
-                        "timestamp": analysis.data_points[i].timestamp,
-                        "from_bitrate": prev_bitrate,
-                        "to_bitrate": curr_bitrate,
-                        "change_ratio": change_ratio
-                    })
+        # Change between consecutive samples (skipping zero bitrates to avoid dividing by zero)
+        ratios, positions = change_ratios(bitrates)
+        
+        # >10% change considered significant
+        significant = np.flatnonzero(ratios > 0.1)
+        
+        # Top 5 by change ratio: partition down to the candidates (ties at the cut
+        # included), then stable-sort only those so ties keep time order
+        top = significant
+        if len(top) > 5:
+            cutoff = np.partition(ratios[top], -5)[-5]
+            top = top[ratios[top] >= cutoff]
+        top = top[np.argsort(-ratios[top], kind='stable')[:5]]
+        change_points = [
+            {
+                "timestamp": float(analysis.timestamps[i]),
+                "from_bitrate": float(bitrates[i - 1]),
+                "to_bitrate": float(bitrates[i]),
+                "change_ratio": float(ratio)
+            }
+            for i, ratio in zip(positions[top], ratios[top])
+        ]
         
         return {
-            "total_changes": len(changes),
-            "significant_changes": significant_changes,
-            "max_change": max(changes) if changes else 0,
-            "change_points": sorted(change_points, key=lambda x: x["change_ratio"], reverse=True)[:5]
+            "total_changes": len(ratios),
+            "significant_changes": len(significant),
+            "max_change": float(ratios.max()) if len(ratios) else 0,
+            "change_points": change_points
         }
     
     def _rate_sample_rate(self, sample_rate: int) -> str:
@@ -451,7 +540,7 @@ class AudioBitrateAnalyzer:
         data = {
             "metadata": {
                 "file_path": analysis.file_path,
-                "analysis_time": datetime.now().isoformat(),
+                "analysis_time": datetime.now(),
                 "sample_interval": analysis.sample_interval,
                 "duration": analysis.duration
             },
@@ -474,18 +563,22 @@ class AudioBitrateAnalyzer:
                 }
             },
             "quality_assessment": quality_assessment,
+            # Built straight from the arrays (no per-sample dataclasses); same JSON shape
             "data_points": [
                 {
-                    "timestamp": dp.timestamp,
-                    "bitrate": dp.bitrate,
-                    "bitrate_kbps": dp.bitrate / 1000
+                    "timestamp": timestamp,
+                    "bitrate": bitrate,
+                    "bitrate_kbps": bitrate_kbps
                 }
-                for dp in analysis.data_points
+                for timestamp, bitrate, bitrate_kbps in zip(
+                    analysis.timestamps.tolist(),
+                    analysis.bitrates.tolist(),
+                    (analysis.bitrates / 1000).tolist()
+                )
             ]
         }
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        dump_json(data, output_path)
         
         self._logger.info(f"Audio analysis exported to: {output_path}")
         
@@ -500,14 +593,14 @@ class AudioBitrateAnalyzer:
     
     def export_to_csv(self, analysis: AudioBitrateAnalysis, output_path: str):
         """Export to CSV format"""
-        import csv
-        
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        with open(output_path, 'w', newline='', encoding='utf-8', buffering=_CSV_BUFFER_SIZE) as f:
             writer = csv.writer(f)
             writer.writerow(['timestamp', 'bitrate_bps', 'bitrate_kbps'])
-            
-            for dp in analysis.data_points:
-                writer.writerow([dp.timestamp, dp.bitrate, dp.bitrate / 1000])  # 保留原始值和kbps
+            writer.writerows(zip(  # 保留原始值和kbps
+                analysis.timestamps.tolist(),
+                analysis.bitrates.tolist(),
+                (analysis.bitrates / 1000).tolist()
+            ))
         
         self._logger.info(f"Data exported to: {output_path}")
 
@@ -520,15 +613,18 @@ def analyze_multiple_audio(video_files: List[str], sample_interval: float = 15.0
     analyzer = AudioBitrateAnalyzer(sample_interval)
     _logger = get_logger(__name__)
     
-    results = []
-    for video_file in video_files:
+    def _analyze_one(video_file: str) -> Optional[AudioBitrateAnalysis]:
         try:
             processed_file = processor.process_input(video_file)
             result = analyzer.analyze(processed_file)
-            results.append(result)
             _logger.info(f"Completed audio analysis: {video_file}")
-            
+            return result
         except Exception as e:
             _logger.error(f"Audio analysis failed {video_file}: {e}")
+            return None
     
-    return results
\ No newline at end of file
+    # Work is dominated by ffprobe subprocesses (themselves multi-threaded),
+    # so a modest thread pool overlaps them without oversubscribing the CPU
+    max_workers = max(1, min(len(video_files), (os.cpu_count() or 2) // 2))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return [result for result in executor.map(_analyze_one, video_files) if result is not None]
@@ -365,7 +365,7 @@ def create_enhanced_analysis_info(
         actual_avg_fps=fps_analysis.actual_average_fps if fps_analysis else 0,
         fps_variance=fps_analysis.fps_variance if fps_analysis else 0,
         video_data_points=len(video_analysis.data_points) if video_analysis else 0,
-        audio_data_points=len(audio_analysis.data_points) if audio_analysis else 0,
+        audio_data_points=len(audio_analysis.bitrates) if audio_analysis else 0,
         fps_data_points=len(fps_analysis.data_points) if fps_analysis else 0,
     )
     
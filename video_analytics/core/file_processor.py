@@ -1,9 +1,14 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Mapping, Optional, Tuple
 import os
+import shutil
 import tempfile
-import requests
+import time
+from urllib.parse import urlparse
 import ffmpeg
+from rich.progress import Progress, BarColumn, TextColumn, DownloadColumn
 from ..utils.logger import get_logger
 from ..utils.validators import (
     validate_file_path,
@@ -14,8 +19,13 @@ from ..utils.validators import (
     ValidationError,
 )
 from ..utils.download_cache import get_download_cache
+from ..utils.http_session import get_http_session
+from ..utils.probe_cache import cached_probe
 from .hls_downloader import HLSDownloader
 
+# Read size for streamed HTTP downloads (bytes)
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
+
 
 @dataclass
 class VideoMetadata:
@@ -62,7 +72,7 @@ class ProcessedFile:
     def _extract_metadata(self) -> VideoMetadata:
         """Extract video metadata"""
         try:
-            probe = ffmpeg.probe(self.file_path)
+            probe = cached_probe(self.file_path)
             format_info = probe['format']
             
             # Find video and audio streams
@@ -117,7 +127,7 @@ class ProcessedFile:
                 if self._attempt_file_fix():
                     try:
                         # Retry probe after fixing
-                        probe = ffmpeg.probe(self.file_path)
+                        probe = cached_probe(self.file_path)
                         format_info = probe['format']
                         
                         # Find video and audio streams
@@ -162,8 +172,6 @@ class ProcessedFile:
     def _attempt_file_fix(self) -> bool:
         """Attempt to fix common HLS/fMP4 format issues"""
         try:
-            import shutil
-            from ..utils.logger import get_logger
             logger = get_logger(__name__)
             
             # Create a fixed version using FFmpeg
@@ -268,18 +276,25 @@ class ProcessedFile:
 class FileProcessor:
     """File processor"""
     
-    def __init__(self, use_cache: bool = True, max_workers: int = 10):
+    def __init__(self, use_cache: bool = True, max_workers: int = 10, show_progress: bool = True,
+                 interactive: bool = True):
         """
         Initialize file processor
         
         Args:
             use_cache: Whether to use download cache
             max_workers: Maximum download threads for HLS
+            show_progress: Show live download progress bars (disable when the caller
+                already drives its own live display)
+            interactive: Allow confirmation prompts before large downloads (disable
+                when running off the main thread)
         """
         self.use_cache = use_cache
         self.max_workers = max_workers
+        self.show_progress = show_progress
         self.cache = get_download_cache() if use_cache else None
-        self.hls_downloader = HLSDownloader(max_workers=max_workers)
+        self.hls_downloader = HLSDownloader(max_workers=max_workers, show_progress=show_progress,
+                                            interactive=interactive)
         self.logger = get_logger(__name__)
     
     def process_input(self, input_path: str, force_download: bool = False) -> ProcessedFile:
@@ -323,28 +338,31 @@ class FileProcessor:
         """Process HLS stream input"""
         self.logger.info(f"Processing HLS stream: {hls_url[:50]}...")
         
-        # Check cache first (unless forced download)
-        if self.use_cache and not force_download:
-            cached_path = self.cache.get_cached_file(hls_url)
-            if cached_path:
-                self.logger.info("Using cached HLS file")
-                return ProcessedFile(cached_path, original_url=hls_url, is_cached=True)
-        
-        # Download HLS stream
-        self.logger.info("Downloading HLS stream...")
-        download_result = self.hls_downloader.download_hls_stream(hls_url)
-        
-        if not download_result.success:
-            raise ValidationError(f"HLS download failed: {download_result.error_message}")
-        
-        # Add to cache
-        if self.use_cache and download_result.local_file_path:
-            self.cache.add_to_cache(
-                url=hls_url,
-                file_path=download_result.local_file_path,
-                duration=download_result.duration,
-                format_name='mp4'
-            )
+        # Lookup, insert and eviction share one metadata write
+        with self._cache_batch():
+            # Check cache first (unless forced download)
+            if self.use_cache and not force_download:
+                cached_path = self.cache.get_cached_file(hls_url)
+                if cached_path:
+                    self.logger.info("Using cached HLS file")
+                    return ProcessedFile(cached_path, original_url=hls_url, is_cached=True)
+            
+            # Download HLS stream
+            self.logger.info("Downloading HLS stream...")
+            download_result = self.hls_downloader.download_hls_stream(hls_url)
+            
+            if not download_result.success:
+                raise ValidationError(f"HLS download failed: {download_result.error_message}")
+            
+            # Add to cache
+            if self.use_cache and download_result.local_file_path:
+                self.cache.add_to_cache(
+                    url=hls_url,
+                    file_path=download_result.local_file_path,
+                    duration=download_result.duration,
+                    format_name='mp4',
+                    file_size=download_result.total_size or None
+                )
         
         return ProcessedFile(
             download_result.local_file_path,
@@ -356,45 +374,82 @@ class FileProcessor:
         """Process HTTP URL input"""
         self.logger.info(f"Processing HTTP URL: {url[:50]}...")
         
-        # Check cache first (unless forced download)
-        if self.use_cache and not force_download:
-            cached_path = self.cache.get_cached_file(url)
-            if cached_path:
-                self.logger.info("Using cached URL file")
-                return ProcessedFile(cached_path, original_url=url, is_cached=True)
+        with self._cache_batch():
+            # Check cache first (unless forced download)
+            if self.use_cache and not force_download:
+                cached_path = self.cache.get_cached_file(url)
+                if cached_path:
+                    if self._is_cached_url_fresh(url):
+                        self.logger.info("Using cached URL file")
+                        return ProcessedFile(cached_path, original_url=url, is_cached=True)
+                    self.logger.info("Cached URL file is stale, downloading again")
+                    self.cache.remove_from_cache(url)
+            
+            # Download file
+            local_path, file_size, headers = self._download_http_file(url)
+            
+            # Add to cache
+            if self.use_cache and local_path:
+                self.cache.add_to_cache(
+                    url=url,
+                    file_path=local_path,
+                    file_size=file_size,
+                    etag=headers.get('ETag', ''),
+                    last_modified=headers.get('Last-Modified', '')
+                )
         
-        # Download file
-        local_path = self._download_http_file(url)
+        return ProcessedFile(local_path, original_url=url, is_cached=False)
+    
+    def _is_cached_url_fresh(self, url: str) -> bool:
+        """Revalidate a cached URL download with a conditional HEAD (304 = unchanged)"""
+        entry = self.cache.get_entry(url)
+        if entry is None or not (entry.etag or entry.last_modified):
+            return True  # Nothing to revalidate against
         
-        # Add to cache
-        if self.use_cache and local_path:
-            self.cache.add_to_cache(url=url, file_path=local_path)
+        headers = {}
+        if entry.etag:
+            headers['If-None-Match'] = entry.etag
+        if entry.last_modified:
+            headers['If-Modified-Since'] = entry.last_modified
         
-        return ProcessedFile(local_path, original_url=url, is_cached=False)
+        try:
+            response = get_http_session().head(url, headers=headers, timeout=5, allow_redirects=True)
+        except Exception as e:
+            self.logger.debug(f"Cache revalidation failed, using cached copy: {e}")
+            return True
+        
+        if response.status_code == 304 or not response.ok:
+            return True
+        
+        # Some servers ignore conditional HEADs; compare validators directly
+        etag = response.headers.get('ETag')
+        if entry.etag and etag:
+            return etag == entry.etag
+        last_modified = response.headers.get('Last-Modified')
+        if entry.last_modified and last_modified:
+            return last_modified == entry.last_modified
+        return True
     
-    def _download_http_file(self, url: str) -> str:
-        """Download file from HTTP URL"""
+    def _cache_batch(self):
+        """Batch cache index writes for one input (no-op without cache)"""
+        if self.cache is None:
+            return nullcontext()
+        return self.cache.batch_update()
+    
+    def _download_http_file(self, url: str) -> Tuple[str, int, Mapping[str, str]]:
+        """Download file from HTTP URL; returns (local path, bytes written, response headers)"""
+        local_path = None
         try:
-            # Create temporary file
-            import tempfile
-            from urllib.parse import urlparse
-            import os
-            
+            # Name the temporary file after the URL, made unique: inputs download concurrently
+            # and different URLs often share a basename (e.g. video.mp4?id=1 and ?id=2)
             parsed_url = urlparse(url)
             filename = os.path.basename(parsed_url.path) or 'video'
             if '.' not in filename:
                 filename += '.mp4'  # Default extension
-            
-            temp_dir = tempfile.gettempdir()
-            local_path = os.path.join(temp_dir, filename)
+            stem, ext = os.path.splitext(filename)
             
             # Download with progress
-            from rich.progress import Progress, BarColumn, TextColumn, DownloadColumn
-            from rich.console import Console
-            
-            console = Console()
-            
-            with requests.get(url, stream=True, timeout=30) as response:
+            with get_http_session().get(url, stream=True, timeout=30) as response:
                 response.raise_for_status()
                 
                 total_size = int(response.headers.get('content-length', 0))
@@ -403,21 +458,64 @@ class FileProcessor:
                     TextColumn("[progress.description]{task.description}"),
                     BarColumn(),
                     DownloadColumn(),
-                    console=console
+                    refresh_per_second=10,
+                    disable=not self.show_progress
                 ) as progress:
                     
                     download_task = progress.add_task("Downloading", total=total_size)
                     
-                    with open(local_path, 'wb') as f:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            if chunk:
-                                f.write(chunk)
-                                progress.update(download_task, advance=len(chunk))
+                    response.raw.decode_content = True
+                    
+                    fd, local_path = tempfile.mkstemp(prefix=f"{stem}_", suffix=ext)
+                    with os.fdopen(fd, 'wb') as f:
+                        # Reserve the full size up front so large files aren't fragmented
+                        if total_size > 0 and hasattr(os, 'posix_fallocate') and \
+                                not response.headers.get('content-encoding'):
+                            try:
+                                os.posix_fallocate(f.fileno(), 0, total_size)
+                            except OSError:
+                                pass
+                        
+                        # Report progress at most every 100ms instead of per chunk
+                        written = 0
+                        pending = 0
+                        last_update = time.monotonic()
+                        
+                        # Disk writes go to a worker thread so the next socket read overlaps
+                        # the previous write; at most one write is in flight at a time
+                        with ThreadPoolExecutor(max_workers=1) as writer:
+                            pending_write = None
+                            while True:
+                                chunk = response.raw.read(_DOWNLOAD_CHUNK_SIZE)
+                                if not chunk:
+                                    break
+                                if pending_write is not None:
+                                    pending_write.result()
+                                pending_write = writer.submit(f.write, chunk)
+                                written += len(chunk)
+                                pending += len(chunk)
+                                now = time.monotonic()
+                                if now - last_update >= 0.1:
+                                    progress.update(download_task, advance=pending)
+                                    pending = 0
+                                    last_update = now
+                            if pending_write is not None:
+                                pending_write.result()
+                        if pending:
+                            progress.update(download_task, advance=pending)
+                        
+                        # Drop any reserved tail if the body came up short
+                        f.truncate()
             
-            self.logger.info(f"Downloaded to: {local_path}")
-            return local_path
+            self.logger.info(f"Downloaded to: {local_path} ({written/1024/1024:.1f} MB)")
+            return local_path, written, response.headers
             
         except Exception as e:
+            if local_path is not None:
+                try:
+                    os.remove(local_path)  # Drop the partial download
+                except OSError:
+                    pass
             raise ValidationError(f"HTTP download failed: {e}")
 
 
@@ -437,7 +535,8 @@ class CorruptedFileError(FileProcessingError):
 
 
 def safe_process_file(input_path: str, force_download: bool = False, 
-                      use_cache: bool = True, max_workers: int = 10) -> Optional[ProcessedFile]:
+                      use_cache: bool = True, max_workers: int = 10,
+                      show_progress: bool = True, interactive: bool = True) -> Optional[ProcessedFile]:
     """
     Safely process input - file, URL, or HLS stream
     
@@ -446,12 +545,15 @@ def safe_process_file(input_path: str, force_download: bool = False,
         force_download: Force re-download even if cached
         use_cache: Whether to use download cache
         max_workers: Maximum download threads for HLS
+        show_progress: Show live download progress bars
+        interactive: Allow confirmation prompts before large downloads
         
     Returns:
         ProcessedFile if successful, None on error
     """
     try:
-        processor = FileProcessor(use_cache=use_cache, max_workers=max_workers)
+        processor = FileProcessor(use_cache=use_cache, max_workers=max_workers,
+                                  show_progress=show_progress, interactive=interactive)
         return processor.process_input(input_path, force_download=force_download)
         
     except FileNotFoundError:
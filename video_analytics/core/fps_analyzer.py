@@ -3,17 +3,24 @@ FPS analysis module
 Analyzes frame rate changes, detects dropped frames, and assesses performance.
 """
 
-import json
+import csv
+import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import List, Optional
 from datetime import datetime
 import numpy as np
 
 from .file_processor import ProcessedFile
+from .stats import summarize
 from ..utils.logger import get_logger
+from ..utils.json_io import dump_json
 from ..utils.validators import ensure_non_empty_sequence
 
+# Write buffer for CSV exports (bytes)
+_CSV_BUFFER_SIZE = 1 << 20
+
 
 @dataclass
 class FPSDataPoint:
@@ -113,7 +120,8 @@ class FPSAnalyzer:
                 fps_data = self._analyze_fps_window(
                     processed_file.file_path, 
                     timestamp, 
-                    declared_fps
+                    declared_fps,
+                    duration
                 )
                 data_points.append(fps_data)
                 total_frames += fps_data.frame_count
@@ -139,18 +147,17 @@ class FPSAnalyzer:
         ensure_non_empty_sequence("fps data points", data_points)
         
         # Stats
-        fps_values = [dp.fps for dp in data_points]
         # Actual average FPS - based on per-sample values
-        actual_avg_fps = np.mean(fps_values) if fps_values else 0
+        actual_avg_fps, max_fps, min_fps, fps_variance = summarize([dp.fps for dp in data_points])
         
         return FPSAnalysis(
             file_path=processed_file.file_path,
             duration=duration,
             declared_fps=declared_fps,
             actual_average_fps=actual_avg_fps,
-            max_fps=np.max(fps_values),
-            min_fps=np.min(fps_values),
-            fps_variance=np.var(fps_values),
+            max_fps=max_fps,
+            min_fps=min_fps,
+            fps_variance=fps_variance,
             total_frames=total_frames,
             total_dropped_frames=total_dropped,
             data_points=data_points,
@@ -158,13 +165,10 @@ class FPSAnalyzer:
         )
     
     def _analyze_fps_window(self, file_path: str, timestamp: float, expected_fps: float, 
-                           window_size: float = 5.0) -> FPSDataPoint:
+                           duration: float, window_size: float = 5.0) -> FPSDataPoint:
         """Analyze real FPS within a given time window"""
         try:
-            # Check bounds
-            metadata = self._get_file_metadata(file_path)
-            duration = metadata['duration']
-            
+            # Check bounds against the already-loaded duration (no per-window probe)
             if timestamp > duration:
                 # Out of bounds
                 return FPSDataPoint(
@@ -222,18 +226,6 @@ class FPSAnalyzer:
             dropped_frames=0
         )
     
-    def _get_file_metadata(self, file_path: str) -> dict:
-        """Get basic file metadata"""
-        try:
-            import ffmpeg
-            probe = ffmpeg.probe(file_path)
-            format_info = probe.get('format', {})
-            return {
-                'duration': float(format_info.get('duration', 0))
-            }
-        except Exception:
-            return {'duration': 0}
-    
     def _get_frame_timestamps(self, file_path: str, start_time: float, window_size: float) -> List[float]:
         """Get real frame timestamps within the window"""
         end_time = start_time + window_size
@@ -257,6 +249,7 @@ class FPSAnalyzer:
                 cmd_backup = [
                     'ffprobe',
                     '-v', 'quiet',
+                    '-threads', '0',  # this fallback decodes frames; let the decoder use all cores
                     '-select_streams', 'v:0',
                     '-show_frames',
                     '-show_entries', 'frame=pkt_pts_time',
@@ -461,7 +454,7 @@ class FPSAnalyzer:
         data = {
             "metadata": {
                 "file_path": analysis.file_path,
-                "analysis_time": datetime.now().isoformat(),
+                "analysis_time": datetime.now(),
                 "sample_interval": analysis.sample_interval,
                 "duration": analysis.duration
             },
@@ -493,21 +486,18 @@ class FPSAnalyzer:
             ]
         }
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        dump_json(data, output_path)
         
         self._logger.info(f"FPS analysis exported to: {output_path}")
     
     def export_to_csv(self, analysis: FPSAnalysis, output_path: str):
         """Export to CSV"""
-        import csv
-        
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        with open(output_path, 'w', newline='', encoding='utf-8', buffering=_CSV_BUFFER_SIZE) as f:
             writer = csv.writer(f)
             writer.writerow(['timestamp', 'fps', 'frame_count', 'dropped_frames'])
-            
-            for dp in analysis.data_points:
-                writer.writerow([dp.timestamp, dp.fps, dp.frame_count, dp.dropped_frames])
+            writer.writerows(
+                (dp.timestamp, dp.fps, dp.frame_count, dp.dropped_frames) for dp in analysis.data_points
+            )
         
         self._logger.info(f"Data exported to: {output_path}")
 
@@ -520,15 +510,18 @@ def analyze_multiple_fps(video_files: List[str], sample_interval: float = 10.0)
     analyzer = FPSAnalyzer(sample_interval)
     _logger = get_logger(__name__)
     
-    results = []
-    for video_file in video_files:
+    def _analyze_one(video_file: str) -> Optional[FPSAnalysis]:
         try:
             processed_file = processor.process_input(video_file)
             result = analyzer.analyze(processed_file)
-            results.append(result)
             _logger.info(f"Completed FPS analysis: {video_file}")
-            
+            return result
         except Exception as e:
             _logger.error(f"FPS analysis failed {video_file}: {e}")
+            return None
     
-    return results
\ No newline at end of file
+    # Work is dominated by ffprobe subprocesses (themselves multi-threaded),
+    # so a modest thread pool overlaps them without oversubscribing the CPU
+    max_workers = max(1, min(len(video_files), (os.cpu_count() or 2) // 2))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return [result for result in executor.map(_analyze_one, video_files) if result is not None]
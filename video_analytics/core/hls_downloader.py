@@ -16,12 +16,13 @@ from typing import List, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 from dataclasses import dataclass
 
-import requests
 import m3u8
+import ffmpeg
 from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn, DownloadColumn, SpinnerColumn, TransferSpeedColumn
 from rich.console import Console
 
 from ..utils.logger import get_logger
+from ..utils.http_session import create_http_session
 
 logger = get_logger(__name__)
 console = Console()
@@ -50,17 +51,23 @@ class DownloadResult:
 class HLSDownloader:
     """High-performance HLS stream downloader"""
     
-    def __init__(self, max_workers: int = 10, timeout: int = 30):
+    def __init__(self, max_workers: int = 10, timeout: int = 30, show_progress: bool = True,
+                 interactive: bool = True):
         """
         Initialize HLS downloader
         
         Args:
             max_workers: Maximum concurrent download threads
             timeout: Request timeout in seconds
+            show_progress: Show live download progress bars
+            interactive: Ask before large downloads (False: never read stdin, just log)
         """
         self.max_workers = max_workers
         self.timeout = timeout
-        self.session = requests.Session()
+        self.show_progress = show_progress
+        self.interactive = interactive
+        # Pool sized to the worker count so concurrent segment fetches reuse connections
+        self.session = create_http_session(pool_maxsize=max(max_workers, 20))
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': '*/*',
@@ -115,12 +122,15 @@ class HLSDownloader:
             # First estimate file size for user confirmation
             estimated_size_mb, estimated_duration = self.estimate_download_time(hls_url)
             
+            # Non-interactive callers (e.g. downloads on worker threads) get no prompt or console output
+            if not self.interactive:
+                if estimated_size_mb > 500:
+                    logger.info(f"Large HLS download: ~{estimated_size_mb:.1f} MB, "
+                                f"{estimated_duration/60:.1f} min")
             # Show user confirmation for large files (>1GB)
-            if estimated_size_mb > 1000:
-                from rich.console import Console
+            elif estimated_size_mb > 1000:
                 from rich.prompt import Confirm
                 
-                console = Console()
                 console.print(f"\n[yellow]检测到大文件下载：[/yellow]")
                 console.print(f"  预估大小: [bold]{estimated_size_mb:.1f} MB[/bold]")
                 console.print(f"  预估时长: [bold]{estimated_duration/60:.1f} 分钟[/bold]")
@@ -134,12 +144,8 @@ class HLSDownloader:
                 
                 console.print("\n[green]开始下载...[/green]")
             elif estimated_size_mb > 500:  # Show info for medium files
-                from rich.console import Console
-                console = Console()
                 console.print(f"[blue]下载信息：[/blue] 预估大小 {estimated_size_mb:.1f} MB，时长 {estimated_duration/60:.1f} 分钟")
             
-            import ffmpeg
-            
             logger.info(f"Using FFmpeg native HLS download for {estimated_size_mb:.1f}MB file...")
             
             # Get optimized parameters based on file size
@@ -261,7 +267,8 @@ class HLSDownloader:
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
             TimeRemainingColumn(),
             TransferSpeedColumn(),
-            console=console
+            console=console,
+            disable=not self.show_progress
         ) as progress:
             
             download_task = progress.add_task("FFmpeg下载", total=100)
@@ -444,7 +451,8 @@ class HLSDownloader:
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
             DownloadColumn(),
             TimeRemainingColumn(),
-            console=console
+            console=console,
+            disable=not self.show_progress
         ) as progress:
             
             download_task = progress.add_task("Downloading segments", total=len(segments))
@@ -538,8 +546,6 @@ class HLSDownloader:
     def _merge_segments(self, segment_files: List[str], output_path: str) -> bool:
         """Merge downloaded segments into single video file using FFmpeg"""
         try:
-            import ffmpeg
-            
             # Sort segment files to ensure correct order
             segment_files.sort()
             
@@ -609,8 +615,6 @@ class HLSDownloader:
     def _merge_fmp4_segments(self, segment_files: List[str], output_path: str) -> bool:
         """Merge fMP4 segments using optimal FFmpeg strategy"""
         try:
-            import ffmpeg
-            
             # Strategy 1: Try FFmpeg with explicit fMP4 handling
             logger.info(f"Attempting FFmpeg fMP4 merge for {len(segment_files)} segments...")
             
@@ -666,7 +670,6 @@ class HLSDownloader:
     def _merge_fmp4_with_header_fix(self, segment_files: List[str], output_path: str) -> bool:
         """Advanced fMP4 merge with header reconstruction"""
         try:
-            import ffmpeg
             temp_dir = os.path.dirname(output_path)
             
             # Re-encode first segment to create proper MP4 header
@@ -731,8 +734,6 @@ class HLSDownloader:
     def _merge_fmp4_alternative(self, segment_files: List[str], output_path: str) -> bool:
         """Alternative fMP4 merge using binary concatenation or batch concat"""
         try:
-            import ffmpeg
-            
             # For large number of segments, use binary concatenation (most efficient for fMP4)
             if len(segment_files) > 100:
                 logger.info(f"Using binary concatenation for {len(segment_files)} fMP4 segments")
@@ -766,8 +767,6 @@ class HLSDownloader:
     def _merge_ts_segments(self, segment_files: List[str], output_path: str) -> bool:
         """Merge TS segments using FFmpeg"""
         try:
-            import ffmpeg
-            
             if len(segment_files) == 1:
                 # Single segment, just copy
                 (
@@ -818,8 +817,6 @@ class HLSDownloader:
     def _merge_with_ffmpeg_default(self, segment_files: List[str], output_path: str) -> bool:
         """Default FFmpeg merge approach with fallbacks"""
         try:
-            import ffmpeg
-            
             # Try concat demuxer first
             list_file_path = output_path + '.list'
             
@@ -864,7 +861,6 @@ class HLSDownloader:
     def _merge_with_remux_fallback(self, segment_files: List[str], output_path: str) -> bool:
         """Final fallback: remux each segment and then concat"""
         try:
-            import ffmpeg
             temp_dir = os.path.dirname(output_path)
             remuxed_files = []
             
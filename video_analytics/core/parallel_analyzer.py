@@ -50,6 +50,15 @@ class CombinedAnalysis:
     def has_fps_analysis(self) -> bool:
         return self.fps_analysis is not None
     
+    @property
+    def is_complete(self) -> bool:
+        """视频、音频、FPS分析是否全部成功"""
+        return (
+            self.video_analysis is not None
+            and self.audio_analysis is not None
+            and self.fps_analysis is not None
+        )
+    
     @property
     def success_rate(self) -> float:
         """成功率"""
@@ -111,7 +120,12 @@ class MetadataCache:
 class ParallelAnalysisEngine:
     """并行分析引擎"""
     
-    def __init__(self, config: ParallelConfig = None):
+    def __init__(self, config: ParallelConfig = None, concurrent_files: int = 1):
+        """
+        Args:
+            config: 并行分析配置
+            concurrent_files: 同时调用 analyze_all 的文件数上限（引擎在多个文件间共享时）
+        """
         self.config = config or ParallelConfig()
         self._metadata_cache = MetadataCache()
         self._logger = get_logger(__name__)
@@ -120,6 +134,12 @@ class ParallelAnalysisEngine:
         self._video_analyzer = VideoBitrateAnalyzer(self.config.video_interval)
         self._audio_analyzer = AudioBitrateAnalyzer(self.config.audio_interval)
         self._fps_analyzer = FPSAnalyzer(self.config.fps_interval)
+        
+        # 所有分析任务共享一个线程池：每个在途文件各有 max_workers 个 worker，
+        # 避免文件之间排队（排队时间会计入 execution_time 并触发 task_timeout）
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.config.max_workers * max(1, concurrent_files)
+        )
     
     async def analyze_all(self, processed_file: ProcessedFile) -> CombinedAnalysis:
         """执行全面的并行分析"""
@@ -237,9 +257,7 @@ class ParallelAnalysisEngine:
             return self._video_analyzer.analyze(processed_file)
         
         try:
-            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-                result = await loop.run_in_executor(executor, _analyze)
-                return result
+            return await loop.run_in_executor(self._executor, _analyze)
         except Exception as e:
             self._logger.error(f"Video analysis task exception: {e}")
             return None
@@ -252,9 +270,7 @@ class ParallelAnalysisEngine:
             return self._audio_analyzer.analyze(processed_file)
         
         try:
-            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-                result = await loop.run_in_executor(executor, _analyze)
-                return result
+            return await loop.run_in_executor(self._executor, _analyze)
         except Exception as e:
             self._logger.error(f"Audio analysis task exception: {e}")
             return None
@@ -267,9 +283,7 @@ class ParallelAnalysisEngine:
             return self._fps_analyzer.analyze(processed_file)
         
         try:
-            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-                result = await loop.run_in_executor(executor, _analyze)
-                return result
+            return await loop.run_in_executor(self._executor, _analyze)
         except Exception as e:
             self._logger.error(f"FPS analysis task exception: {e}")
             return None
@@ -291,6 +305,10 @@ class ParallelAnalysisEngine:
         else:
             raise ValueError(f"Unknown analysis type: {analysis_type}")
     
+    def shutdown(self):
+        """释放分析线程池"""
+        self._executor.shutdown(wait=True)
+    
     def clear_cache(self):
         """清空所有缓存"""
         self._metadata_cache.clear()
@@ -323,25 +341,30 @@ async def analyze_file_parallel(
 ) -> CombinedAnalysis:
     """并行分析单个文件的便捷函数"""
     engine = ParallelAnalysisEngine(config)
-    return await engine.analyze_all(processed_file)
+    try:
+        return await engine.analyze_all(processed_file)
+    finally:
+        engine.shutdown()
+
+
+# 时长阈值(秒) -> (video, audio, fps) 采样间隔，按阈值降序匹配
+_FAST_INTERVAL_TIERS = (
+    (14400, (60.0, 90.0, 120.0)),  # >4小时
+    (7200, (45.0, 60.0, 75.0)),    # >2小时
+    (3600, (30.0, 45.0, 60.0)),    # >1小时
+)
 
 
 def create_fast_config(duration: float) -> ParallelConfig:
     """根据视频时长创建快速分析配置"""
     config = ParallelConfig()
     
-    if duration > 14400:  # >4小时
-        config.video_interval = 60.0
-        config.audio_interval = 90.0
-        config.fps_interval = 120.0
-    elif duration > 7200:  # >2小时
-        config.video_interval = 45.0
-        config.audio_interval = 60.0
-        config.fps_interval = 75.0
-    elif duration > 3600:  # >1小时
-        config.video_interval = 30.0
-        config.audio_interval = 45.0
-        config.fps_interval = 60.0
+    for threshold, (video_interval, audio_interval, fps_interval) in _FAST_INTERVAL_TIERS:
+        if duration > threshold:
+            config.video_interval = video_interval
+            config.audio_interval = audio_interval
+            config.fps_interval = fps_interval
+            break
     
     return config
 
@@ -0,0 +1,33 @@
+"""
+Statistics kernels shared by the analyzers.
+Computes mean/max/min/variance and consecutive-sample change ratios of a
+series with numpy reductions.
+"""
+
+from typing import Sequence, Tuple
+
+import numpy as np
+
+
+def summarize(values: Sequence[float]) -> Tuple[float, float, float, float]:
+    """
+    Summarize a non-empty series
+
+    Returns:
+        (mean, max, min, population variance)
+    """
+    arr = np.asarray(values, dtype=np.float64)
+    return float(arr.mean()), float(arr.max()), float(arr.min()), float(arr.var())
+
+
+def change_ratios(values: Sequence[float]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Relative change between consecutive samples, skipping zero predecessors
+
+    Returns:
+        (ratios, index of the later sample of each pair)
+    """
+    arr = np.asarray(values, dtype=np.float64)
+    prev, curr = arr[:-1], arr[1:]
+    valid = prev > 0
+    return np.abs(curr[valid] - prev[valid]) / prev[valid], np.flatnonzero(valid) + 1
@@ -3,17 +3,25 @@ Video bitrate analysis module
 Analyzes video bitrate over time to generate a bitrate time series.
 """
 
-import json
+import csv
+import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import List, Optional
 from datetime import datetime
 import numpy as np
+import ffmpeg
 
 from .file_processor import ProcessedFile
+from .stats import summarize
 from ..utils.logger import get_logger
+from ..utils.json_io import dump_json
 from ..utils.validators import ensure_non_empty_sequence, normalize_interval
 
+# Write buffer for CSV exports (bytes)
+_CSV_BUFFER_SIZE = 1 << 20
+
 
 @dataclass
 class BitrateDataPoint:
@@ -109,15 +117,15 @@ class VideoBitrateAnalyzer:
         ensure_non_empty_sequence("bitrate data points", data_points)
         
         # Compute statistics
-        bitrates = [dp.bitrate for dp in data_points]
+        average, maximum, minimum, variance = summarize([dp.bitrate for dp in data_points])
         
         return VideoBitrateAnalysis(
             file_path=processed_file.file_path,
             duration=duration,
-            average_bitrate=float(np.mean(bitrates)),
-            max_bitrate=float(np.max(bitrates)),
-            min_bitrate=float(np.min(bitrates)),
-            bitrate_variance=float(np.var(bitrates)),
+            average_bitrate=average,
+            max_bitrate=maximum,
+            min_bitrate=minimum,
+            bitrate_variance=variance,
             data_points=data_points,
             sample_interval=interval
         )
@@ -145,6 +153,9 @@ class VideoBitrateAnalyzer:
                 '-select_streams', 'v:0',
                 '-show_entries', 'packet=size,pts_time',
                 '-of', 'csv=p=0',
+                # Seek to the window instead of dumping the whole file; the extra second
+                # covers B-frame reordering past end_time (packets are filtered below)
+                '-read_intervals', f'{start_time}%{end_time + 1}',
                 file_path
             ]
             
@@ -227,7 +238,6 @@ class VideoBitrateAnalyzer:
     def _estimate_bitrate_from_file(self, file_path: str) -> float:
         """Estimate bitrate from file info"""
         try:
-            import ffmpeg
             probe = ffmpeg.probe(file_path)
             
             # Get overall bitrate
@@ -256,7 +266,7 @@ class VideoBitrateAnalyzer:
         data = {
             "metadata": {
                 "file_path": analysis.file_path,
-                "analysis_time": datetime.now().isoformat(),
+                "analysis_time": datetime.now(),
                 "sample_interval": analysis.sample_interval,
                 "duration": analysis.duration
             },
@@ -276,21 +286,16 @@ class VideoBitrateAnalyzer:
             ]
         }
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        dump_json(data, output_path)
         
         self._logger.info(f"Analysis exported to: {output_path}")
     
     def export_to_csv(self, analysis: VideoBitrateAnalysis, output_path: str):
         """Export to CSV"""
-        import csv
-        
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        with open(output_path, 'w', newline='', encoding='utf-8', buffering=_CSV_BUFFER_SIZE) as f:
             writer = csv.writer(f)
             writer.writerow(['timestamp', 'bitrate_mbps'])
-            
-            for dp in analysis.data_points:
-                writer.writerow([dp.timestamp, dp.bitrate / 1000000])  # Mbps
+            writer.writerows((dp.timestamp, dp.bitrate / 1000000) for dp in analysis.data_points)  # Mbps
         
         self._logger.info(f"Data exported to: {output_path}")
 
@@ -303,15 +308,18 @@ def analyze_multiple_videos(video_files: List[str], sample_interval: float = 10.
     analyzer = VideoBitrateAnalyzer(sample_interval)
     _logger = get_logger(__name__)
     
-    results = []
-    for video_file in video_files:
+    def _analyze_one(video_file: str) -> Optional[VideoBitrateAnalysis]:
         try:
             processed_file = processor.process_input(video_file)
             result = analyzer.analyze(processed_file)
-            results.append(result)
             _logger.info(f"Completed analysis: {video_file}")
-            
+            return result
         except Exception as e:
             _logger.error(f"Analysis failed {video_file}: {e}")
+            return None
     
-    return results
\ No newline at end of file
+    # Work is dominated by ffprobe subprocesses (themselves multi-threaded),
+    # so a modest thread pool overlaps them without oversubscribing the CPU
+    max_workers = max(1, min(len(video_files), (os.cpu_count() or 2) // 2))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return [result for result in executor.map(_analyze_one, video_files) if result is not None]
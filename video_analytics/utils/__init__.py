@@ -13,4 +13,4 @@ from .validators import (
     ensure_non_empty_sequence,
     normalize_interval
 )
-from .config import ConfigManager, AnalysisConfig, get_merged_config
\ No newline at end of file
+from .config import ConfigManager, AnalysisConfig, get_config_manager, get_merged_config
\ No newline at end of file
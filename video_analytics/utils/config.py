@@ -8,7 +8,8 @@ import json
 import os
 from pathlib import Path
 from typing import Dict, Any, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, replace
+from functools import lru_cache
 
 from .logger import get_logger
 
@@ -32,6 +33,26 @@ class AnalysisConfig:
     # FFmpeg settings
     ffmpeg_timeout: int = 300  # seconds
 
+_TRUTHY = frozenset({"true", "1", "yes", "on"})
+
+def _to_bool(value: str) -> bool:
+    return value.strip().lower() in _TRUTHY
+
+# Field name -> converter for string values; unlisted fields stay strings
+_FIELD_TYPES = {
+    "interval": float,
+    "verbose": _to_bool,
+    "export_json": _to_bool,
+    "export_csv": _to_bool,
+    "ffmpeg_timeout": int,
+}
+
+def _convert_config_value(key: str, value: Any) -> Any:
+    """Convert string values (e.g. from the command line) to the field's type"""
+    if not isinstance(value, str):
+        return value
+    return _FIELD_TYPES.get(key, str)(value)
+
 class ConfigManager:
     """Configuration file manager"""
     
@@ -39,6 +60,7 @@ class ConfigManager:
         self.config_dir = Path.home() / ".video-analytics"
         self.config_file = self.config_dir / "config.json"
         self._ensure_config_dir()
+        self._loaded: Optional[AnalysisConfig] = None  # Parsed config file, reused across loads
         
     def _ensure_config_dir(self):
         """Ensure config directory exists"""
@@ -50,6 +72,7 @@ class ConfigManager:
             config_dict = asdict(config)
             with open(self.config_file, 'w', encoding='utf-8') as f:
                 json.dump(config_dict, f, indent=2, ensure_ascii=False)
+            self._loaded = replace(config)
             logger.info(f"Configuration saved to {self.config_file}")
             return True
         except Exception as e:
@@ -57,7 +80,13 @@ class ConfigManager:
             return False
     
     def load_config(self) -> AnalysisConfig:
-        """Load configuration from file"""
+        """Load configuration from file (parsed once; callers get their own copy)"""
+        if self._loaded is None:
+            self._loaded = self._read_config()
+        return replace(self._loaded)
+    
+    def _read_config(self) -> AnalysisConfig:
+        """Read and parse the config file"""
         if not self.config_file.exists():
             logger.info("No config file found, using defaults")
             return AnalysisConfig()
@@ -82,6 +111,11 @@ class ConfigManager:
         # Update only valid fields
         for key, value in updates.items():
             if hasattr(config, key):
+                try:
+                    value = _convert_config_value(key, value)
+                except ValueError:
+                    logger.warning(f"Invalid value for {key}: {value!r}")
+                    continue
                 setattr(config, key, value)
                 logger.info(f"Updated config: {key} = {value}")
             else:
@@ -103,9 +137,14 @@ class ConfigManager:
         config = self.load_config()
         return asdict(config)
 
+@lru_cache(maxsize=1)
+def get_config_manager() -> ConfigManager:
+    """Get global config manager instance"""
+    return ConfigManager()
+
 def get_merged_config(cli_args: Dict[str, Any]) -> AnalysisConfig:
     """Merge CLI arguments with config file settings"""
-    config_manager = ConfigManager()
+    config_manager = get_config_manager()
     config = config_manager.load_config()
     
     # CLI arguments override config file
@@ -7,7 +7,10 @@ import os
 import json
 import hashlib
 import shutil
+import threading
 import time
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
@@ -17,6 +20,12 @@ from .logger import get_logger
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _url_cache_key(url: str) -> str:
+    """Hash URL to its cache key (memoized: the same URL is looked up repeatedly)"""
+    return hashlib.sha256(url.encode()).hexdigest()[:16]
+
+
 @dataclass
 class CacheEntry:
     """Cache entry metadata"""
@@ -28,6 +37,8 @@ class CacheEntry:
     duration: float = 0.0
     format_name: str = ""
     is_valid: bool = True
+    etag: str = ""            # HTTP validators for revalidating URL downloads
+    last_modified: str = ""
 
 
 class DownloadCache:
@@ -53,12 +64,41 @@ class DownloadCache:
         # Load existing cache metadata
         self.entries: Dict[str, CacheEntry] = self._load_metadata()
         
+        # Guards entries and metadata writes: inputs are acquired from several threads
+        self._lock = threading.RLock()
+        
+        # Deferred metadata writes (see batch_update); batch depth is per thread
+        self._batch = threading.local()
+        self._dirty = False
+        
         # Clean up invalid entries on init
         self._cleanup_invalid_entries()
     
+    @contextmanager
+    def batch_update(self):
+        """
+        Defer metadata writes until the outermost batch exits
+        
+        Lookups, inserts and evictions inside the block only mark the index
+        dirty; the metadata file is rewritten once on exit. Batches are per
+        thread, so one thread's batch never defers another thread's writes.
+        """
+        depth = getattr(self._batch, 'depth', 0)
+        self._batch.depth = depth + 1
+        try:
+            yield self
+        finally:
+            self._batch.depth = depth
+            if depth == 0 and self._dirty:
+                self._save_metadata()
+    
     def get_cache_key(self, url: str) -> str:
         """Generate cache key from URL"""
-        return hashlib.sha256(url.encode()).hexdigest()[:16]
+        return _url_cache_key(url)
+    
+    def get_entry(self, url: str) -> Optional[CacheEntry]:
+        """Get cache entry metadata for URL (no file checks)"""
+        return self.entries.get(self.get_cache_key(url))
     
     def get_cached_file(self, url: str) -> Optional[str]:
         """
@@ -72,33 +112,34 @@ class DownloadCache:
         """
         cache_key = self.get_cache_key(url)
         
-        if cache_key not in self.entries:
-            return None
-        
-        entry = self.entries[cache_key]
-        
-        # Check if file exists and is valid
-        if not os.path.exists(entry.local_path):
-            logger.info(f"Cache file missing, removing entry: {cache_key}")
-            self._remove_entry(cache_key)
-            return None
-        
-        # Check file integrity
-        current_size = os.path.getsize(entry.local_path)
-        if current_size != entry.file_size:
-            logger.warning(f"Cache file size mismatch, removing entry: {cache_key}")
-            self._remove_entry(cache_key)
-            return None
-        
-        # Update last accessed time
-        entry.last_accessed = time.time()
-        self._save_metadata()
+        with self._lock:
+            entry = self.entries.get(cache_key)
+            if entry is None:
+                return None
+            
+            # Check file exists and integrity with a single stat
+            try:
+                current_size = os.path.getsize(entry.local_path)
+            except OSError:
+                logger.info(f"Cache file missing, removing entry: {cache_key}")
+                self._remove_entry(cache_key)
+                return None
+            
+            if current_size != entry.file_size:
+                logger.warning(f"Cache file size mismatch, removing entry: {cache_key}")
+                self._remove_entry(cache_key)
+                return None
+            
+            # Update last accessed time
+            entry.last_accessed = time.time()
+            self._save_metadata()
         
         logger.info(f"Using cached file for {url[:50]}...")
         return entry.local_path
     
     def add_to_cache(self, url: str, file_path: str, duration: float = 0.0, 
-                     format_name: str = "") -> bool:
+                     format_name: str = "", file_size: Optional[int] = None,
+                     etag: str = "", last_modified: str = "") -> bool:
         """
         Add file to cache
         
@@ -107,17 +148,22 @@ class DownloadCache:
             file_path: Local file path to cache
             duration: Video duration in seconds
             format_name: Video format
+            file_size: Size in bytes if already known (skips a stat)
+            etag: HTTP ETag of the downloaded resource
+            last_modified: HTTP Last-Modified of the downloaded resource
             
         Returns:
             True if successfully added to cache
         """
-        if not os.path.exists(file_path):
-            logger.error(f"File does not exist: {file_path}")
-            return False
+        if file_size is None:
+            try:
+                file_size = os.path.getsize(file_path)
+            except OSError:
+                logger.error(f"File does not exist: {file_path}")
+                return False
         
         try:
             cache_key = self.get_cache_key(url)
-            file_size = os.path.getsize(file_path)
             
             # Create cached filename
             file_ext = os.path.splitext(file_path)[1] or '.mp4'
@@ -138,14 +184,17 @@ class DownloadCache:
                 last_accessed=time.time(),
                 duration=duration,
                 format_name=format_name,
-                is_valid=True
+                is_valid=True,
+                etag=etag,
+                last_modified=last_modified
             )
             
-            self.entries[cache_key] = entry
-            self._save_metadata()
-            
-            # Clean up cache if needed
-            self._enforce_cache_limits()
+            with self._lock:
+                self.entries[cache_key] = entry
+                self._save_metadata()
+                
+                # Clean up cache if needed
+                self._enforce_cache_limits()
             
             return True
             
@@ -168,14 +217,17 @@ class DownloadCache:
         files_removed = 0
         total_size = 0
         
-        for entry in list(self.entries.values()):
-            if os.path.exists(entry.local_path):
+        with self._lock:
+            for entry in list(self.entries.values()):
+                try:
+                    os.remove(entry.local_path)
+                except FileNotFoundError:
+                    continue
                 total_size += entry.file_size
-                os.remove(entry.local_path)
                 files_removed += 1
-        
-        self.entries.clear()
-        self._save_metadata()
+            
+            self.entries.clear()
+            self._save_metadata()
         
         total_size_mb = total_size // (1024 * 1024)
         logger.info(f"Cache cleared: {files_removed} files, {total_size_mb} MB freed")
@@ -184,12 +236,14 @@ class DownloadCache:
     
     def get_cache_info(self) -> Dict:
         """Get cache statistics"""
-        total_files = len(self.entries)
-        total_size = sum(entry.file_size for entry in self.entries.values())
+        with self._lock:
+            entries = list(self.entries.values())
+        total_files = len(entries)
+        total_size = sum(entry.file_size for entry in entries)
         
         # Check disk usage
         if total_files > 0:
-            valid_files = sum(1 for entry in self.entries.values() 
+            valid_files = sum(1 for entry in entries 
                             if os.path.exists(entry.local_path))
         else:
             valid_files = 0
@@ -204,10 +258,15 @@ class DownloadCache:
         }
     
     def list_cached_files(self) -> List[Dict]:
-        """List all cached files with metadata"""
-        cached_files = []
+        """List cached files with metadata, most recently accessed first"""
+        with self._lock:
+            items = list(self.entries.items())
         
-        for cache_key, entry in self.entries.items():
+        # Order on the raw timestamps before formatting them
+        items.sort(key=lambda item: item[1].last_accessed, reverse=True)
+        
+        cached_files = []
+        for cache_key, entry in items:
             file_exists = os.path.exists(entry.local_path)
             
             cached_files.append({
@@ -223,8 +282,6 @@ class DownloadCache:
                 'valid': entry.is_valid and file_exists
             })
         
-        # Sort by last accessed (most recent first)
-        cached_files.sort(key=lambda x: x['last_accessed'], reverse=True)
         return cached_files
     
     def _load_metadata(self) -> Dict[str, CacheEntry]:
@@ -249,35 +306,41 @@ class DownloadCache:
     
     def _save_metadata(self):
         """Save cache metadata to disk"""
-        try:
-            data = {}
-            for cache_key, entry in self.entries.items():
-                data[cache_key] = asdict(entry)
-            
-            with open(self.metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+        if getattr(self._batch, 'depth', 0) > 0:
+            self._dirty = True
+            return
+        
+        with self._lock:
+            try:
+                data = {}
+                for cache_key, entry in self.entries.items():
+                    data[cache_key] = asdict(entry)
                 
-        except Exception as e:
-            logger.error(f"Failed to save cache metadata: {e}")
+                with open(self.metadata_file, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2)
+                self._dirty = False
+                    
+            except Exception as e:
+                logger.error(f"Failed to save cache metadata: {e}")
     
     def _remove_entry(self, cache_key: str) -> bool:
         """Remove cache entry and associated file"""
-        if cache_key not in self.entries:
-            return False
-        
-        entry = self.entries[cache_key]
-        
-        # Remove file if exists
-        if os.path.exists(entry.local_path):
+        with self._lock:
+            entry = self.entries.pop(cache_key, None)
+            if entry is None:
+                return False
+            
+            # Remove file if exists
             try:
                 os.remove(entry.local_path)
                 logger.info(f"Removed cached file: {entry.local_path}")
+            except FileNotFoundError:
+                pass
             except Exception as e:
                 logger.error(f"Failed to remove cached file: {e}")
-        
-        # Remove from metadata
-        del self.entries[cache_key]
-        self._save_metadata()
+            
+            # Remove from metadata
+            self._save_metadata()
         
         return True
     
@@ -298,7 +361,7 @@ class DownloadCache:
             logger.info(f"Cleaned up {len(invalid_keys)} invalid cache entries")
     
     def _enforce_cache_limits(self):
-        """Enforce cache size limits by removing oldest files"""
+        """Enforce cache size limits by removing oldest files (caller holds the lock)"""
         total_size = sum(entry.file_size for entry in self.entries.values())
         
         if total_size <= self.max_size_bytes:
@@ -329,11 +392,14 @@ class DownloadCache:
 
 # Global cache instance
 _global_cache: Optional[DownloadCache] = None
+_global_cache_lock = threading.Lock()
 
 
 def get_download_cache() -> DownloadCache:
     """Get global download cache instance"""
     global _global_cache
     if _global_cache is None:
-        _global_cache = DownloadCache()
+        with _global_cache_lock:
+            if _global_cache is None:
+                _global_cache = DownloadCache()
     return _global_cache
\ No newline at end of file
@@ -0,0 +1,58 @@
+"""
+HTTP Session - Shared pooled session for remote downloads.
+Reuses keep-alive connections so repeated requests to the same host skip
+the TCP/TLS handshake.
+"""
+
+import atexit
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def create_http_session(pool_connections: int = 10, pool_maxsize: int = 20) -> requests.Session:
+    """
+    Create a session with connection pooling and transient-error retries
+
+    Args:
+        pool_connections: Number of host pools to keep
+        pool_maxsize: Maximum connections kept per host
+
+    Returns:
+        Configured requests.Session
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504]
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry
+    )
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Global session instance
+_global_session: Optional[requests.Session] = None
+
+
+def get_http_session() -> requests.Session:
+    """Get global HTTP session instance"""
+    global _global_session
+    if _global_session is None:
+        _global_session = create_http_session()
+        atexit.register(_global_session.close)
+        logger.debug("Created shared HTTP session")
+    return _global_session
@@ -0,0 +1,41 @@
+"""
+JSON IO - Fast JSON export helpers.
+Uses orjson when installed and falls back to the standard library.
+"""
+
+import json
+from datetime import date, datetime
+from typing import Any
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # Fallback to stdlib json
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize the types orjson handles natively (datetime, numpy) for stdlib json"""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if hasattr(obj, 'tolist'):  # numpy arrays and scalars
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dump_json(data: Any, output_path: str) -> None:
+    """Write data to output_path as indented UTF-8 JSON (datetimes as ISO 8601)"""
+    if orjson is not None:
+        try:
+            payload = orjson.dumps(data, default=_json_default, option=_ORJSON_OPTIONS)
+        except TypeError:
+            payload = None  # Unsupported type for orjson; let stdlib json try
+        if payload is not None:
+            with open(output_path, 'wb') as f:
+                f.write(payload)
+            return
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False, default=_json_default)
@@ -0,0 +1,132 @@
+"""
+Probe Cache - Persistent ffprobe results for local media files.
+Keys each entry on (absolute path, size, mtime) so unchanged files are never
+probed twice, across runs as well as within one. Recent entries are also
+kept in memory so repeat lookups within a run skip the disk read.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+import ffmpeg
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+# Entries kept in memory per cache (oldest evicted first)
+_MEMORY_ENTRIES = 128
+
+
+class ProbeCache:
+    """Sidecar cache of ffprobe JSON output"""
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Initialize probe cache
+
+        Args:
+            cache_dir: Cache directory path (default: ~/.video-analytics-cache/ffprobe)
+        """
+        if cache_dir is None:
+            cache_dir = os.path.expanduser("~/.video-analytics-cache/ffprobe")
+
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self._memory: Dict[str, Dict] = {}
+        self._memory_lock = threading.Lock()
+
+    def get_cache_key(self, file_path: str) -> Optional[str]:
+        """Generate cache key from file identity (None if file can't be stat'ed)"""
+        try:
+            abs_path = os.path.abspath(file_path)
+            st = os.stat(abs_path)
+        except OSError:
+            return None
+
+        identity = f"{abs_path}|{st.st_size}|{st.st_mtime_ns}"
+        return hashlib.blake2b(identity.encode(), digest_size=16).hexdigest()
+
+    def probe(self, file_path: str) -> Dict:
+        """
+        Return ffprobe output for file, probing only on cache miss
+
+        Args:
+            file_path: Local media file path
+
+        Returns:
+            ffprobe JSON as dict (same shape as ffmpeg.probe)
+
+        Raises:
+            ffmpeg.Error: If ffprobe fails on a cache miss
+        """
+        cache_key = self.get_cache_key(file_path)
+        if cache_key is None:
+            return ffmpeg.probe(file_path)
+
+        data = self._memory.get(cache_key)
+        if data is not None:
+            return data
+
+        cache_path = self.cache_dir / f"{cache_key}.json"
+
+        if cache_path.exists():
+            try:
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                logger.debug(f"Using cached probe for {file_path}")
+            except (OSError, ValueError) as e:
+                logger.debug(f"Ignoring unreadable probe cache {cache_path}: {e}")
+
+        if data is None:
+            data = ffmpeg.probe(file_path)
+            self._write(cache_path, data)
+
+        self._remember(cache_key, data)
+        return data
+
+    def _remember(self, cache_key: str, data: Dict):
+        """Keep entry in the in-memory layer, evicting the oldest when full"""
+        with self._memory_lock:
+            self._memory[cache_key] = data
+            if len(self._memory) > _MEMORY_ENTRIES:
+                del self._memory[next(iter(self._memory))]
+
+    def _write(self, cache_path: Path, data: Dict):
+        """Write cache entry atomically"""
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=str(self.cache_dir), suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logger.debug(f"Failed to write probe cache: {e}")
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+
+# Global probe cache instance
+_global_probe_cache: Optional[ProbeCache] = None
+
+
+def get_probe_cache() -> ProbeCache:
+    """Get global probe cache instance"""
+    global _global_probe_cache
+    if _global_probe_cache is None:
+        _global_probe_cache = ProbeCache()
+    return _global_probe_cache
+
+
+def cached_probe(file_path: str) -> Dict:
+    """Probe file through the global probe cache"""
+    return get_probe_cache().probe(file_path)
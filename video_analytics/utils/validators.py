@@ -1,6 +1,9 @@
 import os
+import re
+import shutil
 import subprocess
-import requests
+import importlib.util
+from functools import lru_cache
 from typing import Sequence, Optional
 from urllib.parse import urlparse
 
@@ -24,8 +27,12 @@ def validate_file_path(file_path: str) -> None:
         raise ValidationError("File too small; may not be a valid video")
 
 
-def validate_ffmpeg_available(timeout_sec: int = 10) -> None:
-    """Ensure ffmpeg CLI is available and responsive."""
+def validate_ffmpeg_available(timeout_sec: int = 10, check_version: bool = False) -> None:
+    """Ensure ffmpeg CLI is on PATH; only spawn `ffmpeg -version` if check_version."""
+    if shutil.which("ffmpeg") is None:
+        raise ValidationError("FFmpeg not available: ffmpeg not found on PATH")
+    if not check_version:
+        return
     try:
         subprocess.run(["ffmpeg", "-version"], capture_output=True, text=True, timeout=timeout_sec, check=True)
     except Exception as e:
@@ -33,15 +40,11 @@ def validate_ffmpeg_available(timeout_sec: int = 10) -> None:
 
 
 def validate_python_deps() -> None:
-    """Validate critical Python dependencies are importable."""
-    try:
-        import ffmpeg  # noqa: F401
-    except Exception as e:
-        raise ValidationError(f"ffmpeg-python not installed: {e}")
-    try:
-        import matplotlib  # noqa: F401
-    except Exception as e:
-        raise ValidationError(f"matplotlib not installed: {e}")
+    """Validate critical Python dependencies are installed (without importing them)."""
+    if importlib.util.find_spec("ffmpeg") is None:
+        raise ValidationError("ffmpeg-python not installed")
+    if importlib.util.find_spec("matplotlib") is None:
+        raise ValidationError("matplotlib not installed")
 
 
 def validate_metadata(metadata) -> None:
@@ -60,7 +63,7 @@ def validate_metadata(metadata) -> None:
 
 
 def ensure_non_empty_sequence(name: str, seq: Sequence) -> None:
-    if not seq:
+    if seq is None or len(seq) == 0:  # len() so numpy arrays work too
         raise ValidationError(f"Empty sequence: {name}")
 
 
@@ -73,41 +76,56 @@ def normalize_interval(interval: float, duration: float) -> float:
     return interval
 
 
-def is_url(input_string: str) -> bool:
-    """Check if input string is a URL"""
+# Playlist markers: 'm3u8' anywhere (incl. query strings) or a trailing '.m3u'
+_HLS_MARKERS = re.compile(r'm3u8|\.m3u\Z', re.IGNORECASE)
+
+
+@lru_cache(maxsize=256)
+def classify_url(input_string: str) -> Optional[str]:
+    """
+    Classify input with a single parse (cached: called repeatedly per input)
+    Returns 'hls', 'url' for other http(s) URLs, or None if not a URL
+    """
     if not input_string or not isinstance(input_string, str):
-        return False
+        return None
     
     try:
         parsed = urlparse(input_string)
-        return parsed.scheme in ['http', 'https'] and parsed.netloc
-    except:
-        return False
+    except ValueError:
+        return None
+    
+    if parsed.scheme not in ('http', 'https') or not parsed.netloc:
+        return None
+    return 'hls' if _HLS_MARKERS.search(input_string) else 'url'
+
+
+def is_url(input_string: str) -> bool:
+    """Check if input string is a URL"""
+    return classify_url(input_string) is not None
 
 
 def is_hls_url(url: str) -> bool:
     """Check if URL appears to be HLS stream"""
-    if not is_url(url):
-        return False
-    
-    url_lower = url.lower()
-    return (url_lower.endswith('.m3u8') or 
-            url_lower.endswith('.m3u') or
-            'm3u8' in url_lower)
+    return classify_url(url) == 'hls'
 
 
 def validate_url(url: str, timeout: int = 10) -> None:
     """Validate URL accessibility and content type"""
-    if not is_url(url):
+    url_type = classify_url(url)
+    if url_type is None:
         raise ValidationError(f"Invalid URL format: {url}")
     
+    # Deferred: requests is only needed once a URL is actually checked
+    import requests
+    from .http_session import get_http_session
+    
     try:
         # Use HEAD request for efficiency
-        response = requests.head(url, timeout=timeout, allow_redirects=True)
+        response = get_http_session().head(url, timeout=timeout, allow_redirects=True)
         response.raise_for_status()
         
         # For HLS URLs, we expect text/plain or application/x-mpegURL
-        if is_hls_url(url):
+        if url_type == 'hls':
             content_type = response.headers.get('content-type', '').lower()
             if content_type and not any(ct in content_type for ct in ['text', 'mpegurl', 'm3u']):
                 # Some servers don't set proper content-type, so just warn
@@ -130,14 +148,11 @@ def validate_input(input_path: str) -> str:
     if not input_path or not isinstance(input_path, str):
         raise ValidationError("Invalid input")
     
-    # Check if it's a URL
-    if is_url(input_path):
+    # Check if it's a URL ('url' or 'hls')
+    url_type = classify_url(input_path)
+    if url_type is not None:
         validate_url(input_path)
-        
-        if is_hls_url(input_path):
-            return 'hls'
-        else:
-            return 'url'
+        return url_type
     else:
         # Assume it's a local file path
         validate_file_path(input_path)
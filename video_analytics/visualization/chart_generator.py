@@ -1,11 +1,12 @@
 """
 Chart visualization module
-Converts analysis results into clear PNG charts.
+Converts analysis results into clear PNG (or SVG) charts.
 """
 
 import json
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 
@@ -46,6 +47,10 @@ class ChartConfig:
     show_panels: Optional[List[str]] = None  # ['file_info','codec_info','quality','issues']
     panel_height_ratio: float = 0.4          # fraction of height for panels
 
+    # Output options
+    output_format: str = "png"               # png | svg
+    compress_level: int = 6                  # PNG zlib level (0-9); lower saves faster
+
 
 class ChartGenerator:
     """Chart generator"""
@@ -110,7 +115,7 @@ class ChartGenerator:
 
         # Save
         output_path = self._generate_filename("enhanced_dashboard", config)
-        plt.savefig(output_path, dpi=config.dpi, bbox_inches='tight')
+        self._save_figure(fig, output_path, config)
         plt.close(fig)
         return output_path
     
@@ -150,7 +155,7 @@ class ChartGenerator:
         # Save chart
         output_path = self._generate_filename("video_bitrate", config)
         plt.tight_layout()
-        plt.savefig(output_path, dpi=config.dpi, bbox_inches='tight')
+        self._save_figure(fig, output_path, config)
         plt.close()
         
         return output_path
@@ -161,8 +166,8 @@ class ChartGenerator:
         fig, ax = plt.subplots(figsize=(config.width, config.height))
         
         # Prepare data
-        timestamps = [dp.timestamp / 60 for dp in analysis.data_points]
-        bitrates = [dp.bitrate / 1000 for dp in analysis.data_points]  # kbps
+        timestamps = analysis.timestamps / 60
+        bitrates = analysis.bitrates / 1000  # kbps
         
         # Main line
         ax.plot(timestamps, bitrates,
@@ -191,7 +196,7 @@ class ChartGenerator:
         # Save chart
         output_path = self._generate_filename("audio_bitrate", config)
         plt.tight_layout()
-        plt.savefig(output_path, dpi=config.dpi, bbox_inches='tight')
+        self._save_figure(fig, output_path, config)
         plt.close()
         
         return output_path
@@ -244,7 +249,7 @@ class ChartGenerator:
         # Save chart
         output_path = self._generate_filename("fps_analysis", config)
         plt.tight_layout()
-        plt.savefig(output_path, dpi=config.dpi, bbox_inches='tight')
+        self._save_figure(fig, output_path, config)
         plt.close()
         
         return output_path
@@ -276,8 +281,8 @@ class ChartGenerator:
         
         # 2) Audio bitrate subplot
         ax2 = axes[1]
-        audio_times = [dp.timestamp / 60 for dp in audio_analysis.data_points]
-        audio_rates = [dp.bitrate / 1000 for dp in audio_analysis.data_points]
+        audio_times = audio_analysis.timestamps / 60
+        audio_rates = audio_analysis.bitrates / 1000
         
         ax2.plot(audio_times, audio_rates,
                 color=self.colors['audio'],
@@ -325,7 +330,7 @@ class ChartGenerator:
         
         # Save
         output_path = self._generate_filename("combined_analysis", config)
-        plt.savefig(output_path, dpi=config.dpi, bbox_inches='tight')
+        self._save_figure(fig, output_path, config)
         plt.close()
         
         return output_path
@@ -425,7 +430,7 @@ Dropped Frames: {fps_analysis.total_dropped_frames}
         
         # Save
         output_path = self._generate_filename("summary", config)
-        plt.savefig(output_path, dpi=config.dpi, bbox_inches='tight')
+        self._save_figure(fig, output_path, config)
         plt.close()
         
         return output_path
@@ -483,10 +488,17 @@ Dropped Frames: {fps_analysis.total_dropped_frames}
         
         return results
     
+    def _save_figure(self, fig, output_path: str, config: ChartConfig):
+        """Save figure in the configured format"""
+        save_kwargs = {'dpi': config.dpi, 'bbox_inches': 'tight', 'format': config.output_format}
+        if config.output_format == 'png':
+            save_kwargs['pil_kwargs'] = {'compress_level': config.compress_level}
+        fig.savefig(output_path, **save_kwargs)
+    
     def _generate_filename(self, chart_type: str, config: ChartConfig) -> str:
         """Generate output filename"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{chart_type}_{timestamp}.png"
+        filename = f"{chart_type}_{timestamp}.{config.output_format}"
         
         # Ensure output directory exists
         os.makedirs(config.output_dir, exist_ok=True)
@@ -554,4 +566,29 @@ class ChartStyles:
         cfg.width = max(cfg.width, 16)
         cfg.height = max(cfg.height, 12)
         cfg.panel_height_ratio = 0.4 if info_level != 'basic' else 0.35
-        return cfg
\ No newline at end of file
+        return cfg
+
+    @staticmethod
+    def get_config(name: str) -> ChartConfig:
+        """Fresh config for a named preset (unknown names fall back to 'default')"""
+        return _PRESET_FACTORIES.get(name, ChartStyles.get_default_config)()
+
+    @staticmethod
+    def get_base_config(name: str) -> ChartConfig:
+        """Shared config for a named preset; treat as read-only and derive per-chart copies"""
+        return _cached_preset(name)
+
+
+# Preset name -> factory
+_PRESET_FACTORIES = {
+    'default': ChartStyles.get_default_config,
+    'high_res': ChartStyles.get_high_res_config,
+    'compact': ChartStyles.get_compact_config,
+    'enhanced': ChartStyles.get_enhanced_preset,
+    'enhanced_detailed': lambda: ChartStyles.get_enhanced_preset(info_level='detailed'),
+}
+
+
+@lru_cache(maxsize=None)
+def _cached_preset(name: str) -> ChartConfig:
+    return ChartStyles.get_config(name)
@@ -151,8 +151,8 @@ class MainChartDrawer:
     def _draw_audio_bitrate_chart(self, ax, audio_analysis: AudioBitrateAnalysis):
         """Draw audio bitrate chart"""
         # Prepare data
-        audio_times = [dp.timestamp / 60 for dp in audio_analysis.data_points]  # minutes
-        audio_rates = [dp.bitrate / 1000 for dp in audio_analysis.data_points]  # kbps
+        audio_times = (audio_analysis.timestamps / 60).tolist()  # minutes
+        audio_rates = (audio_analysis.bitrates / 1000).tolist()  # kbps
         
         # Main line
         ax.plot(audio_times, audio_rates,